@@ -0,0 +1,50 @@
+"""Pre-resize character artwork so the selector and avatar can skip resampling.
+
+Run from the repository root after adding or changing character artwork:
+
+    python scripts/generate_thumbnails.py
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from baldi_teacher.character_selector import (  # noqa: E402
+    THUMBNAIL_SIZE,
+    presized_thumbnail_path,
+)
+from baldi_teacher.characters import CHARACTERS  # noqa: E402
+from baldi_teacher.gui_view import AVATAR_SIZE, presized_avatar_path  # noqa: E402
+
+
+def _write_resized(source: Path, target: Path, size: tuple[int, int]) -> None:
+    with Image.open(source) as image:
+        image.thumbnail(size, Image.Resampling.LANCZOS)
+        image.save(target, "WEBP", quality=85, method=6)
+    print(f"Wrote {target.relative_to(REPO_ROOT)}")
+
+
+def main() -> None:
+    assets_dir = REPO_ROOT / "assets"
+    for character in CHARACTERS.values():
+        source = assets_dir / character.thinking_path
+        if not source.exists():
+            print(f"Skipping {character.name}: {source} not found")
+            continue
+        _write_resized(source, presized_thumbnail_path(source), THUMBNAIL_SIZE)
+
+        # Avatar renditions for the main window, which shows both images.
+        for relative in (character.avatar_path, character.thinking_path):
+            avatar_source = assets_dir / relative
+            if avatar_source.exists():
+                _write_resized(avatar_source, presized_avatar_path(avatar_source), AVATAR_SIZE)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,22 @@
 """Baldi teacher chatbot package."""
 
-from .cli import run_cli
-from .gui import run_gui
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli import run_cli
+    from .gui import run_gui
 
 __all__ = ["run_cli", "run_gui"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import entry points on demand so the CLI never loads the Tk/HTML GUI stack.
+    if name == "run_cli":
+        from .cli import run_cli
+
+        return run_cli
+    if name == "run_gui":
+        from .gui import run_gui
+
+        return run_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import io
+import queue
 import sys
 import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
 try:  # Windows standard library support
     import winsound  # type: ignore
 except ImportError:  # pragma: no cover - non-Windows fallback
     winsound = None  # type: ignore
 
+try:  # Optional low-latency PortAudio playback (pip install baldi-teacher[audio])
+    import sounddevice  # type: ignore
+    import soundfile  # type: ignore
+except (ImportError, OSError):  # pragma: no cover - missing package or PortAudio
+    sounddevice = None  # type: ignore
+    soundfile = None  # type: ignore
+
+
+_ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 
 SOUND_FILES: Dict[str, str] = {
     "app_start": "app_start.wav",
@@ -26,80 +37,251 @@ FUNCTION_SOUND_MAP: Dict[str, str] = {
 }
 
 
+class _WinsoundBackend:
+    """Plays WAV bytes through the MCI-backed winsound API."""
+
+    def prepare(self, data: bytes) -> Any:
+        return data
+
+    def play(self, prepared: Any) -> None:
+        winsound.PlaySound(prepared, winsound.SND_MEMORY)
+
+
+class _SoundDeviceBackend:
+    """Plays pre-decoded float32 samples through PortAudio."""
+
+    def prepare(self, data: bytes) -> Any:
+        return soundfile.read(io.BytesIO(data), dtype="float32")
+
+    def play(self, prepared: Any) -> None:
+        samples, samplerate = prepared
+        sounddevice.play(samples, samplerate, blocking=True)
+
+
+def _select_backend() -> Optional[Any]:
+    if sounddevice is not None and soundfile is not None:
+        return _SoundDeviceBackend()
+    if winsound is not None:
+        return _WinsoundBackend()
+    return None
+
+
+_BACKEND = _select_backend()
+
+
+class _Sound(NamedTuple):
+    filename: str
+    data: Optional[Any]  # backend-ready audio; None when the asset is missing
+
+
+# (sound key -> sound, function name -> sound) for one character
+_SoundTables = Tuple[Dict[str, _Sound], Dict[str, _Sound]]
+
+
+class _PlaybackJob(NamedTuple):
+    data: Any
+    done: Optional[threading.Event]
+
+
 class AudioManager:
     """Centralised helper for playing Baldi sound effects."""
 
     def __init__(self, assets_dir: Path, character_audio_subdir: str = "") -> None:
         self._assets_dir = assets_dir
-        self._character_audio_subdir = character_audio_subdir
-        self._lock = threading.Lock()
+        # Root assets are shared by every character, so they load only once.
+        self._shared: Dict[str, _Sound] = {
+            sound_key: self._load(assets_dir / filename, filename)
+            for sound_key, filename in SOUND_FILES.items()
+        }
+        self._shared_tables = self._build_tables(self._shared)
+        # subdir -> (sound key -> sound, function name -> sound); switching back
+        # to a character reuses its tables instead of decoding again.
+        self._tables_by_subdir: Dict[str, _SoundTables] = {}
+        # Guards _subdir/_tables so a late background load cannot overwrite a
+        # newer switch; playback only reads _tables, replaced as a whole.
+        self._tables_lock = threading.Lock()
+        self._subdir = character_audio_subdir
+        self._tables = self._tables_for(character_audio_subdir)
+        self._tables_by_subdir[character_audio_subdir] = self._tables
+        self._queue: "queue.Queue[_PlaybackJob]" = queue.Queue(maxsize=8)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_guard = threading.Lock()
+
+    @property
+    def character_audio_subdir(self) -> str:
+        return self._subdir
+
+    @character_audio_subdir.setter
+    def character_audio_subdir(self, value: str) -> None:
+        with self._tables_lock:
+            self._subdir = value
+            tables = self._tables_by_subdir.get(value)
+            # Shared sounds play until the character's own finish decoding.
+            self._tables = tables or self._shared_tables
+        if tables is None:
+            threading.Thread(
+                target=self._load_tables,
+                args=(value,),
+                name="baldi-audio-load",
+                daemon=True,
+            ).start()
+
+    def play_event(
+        self,
+        sound_key: str,
+        *,
+        blocking: bool = False,
+        done: Optional[threading.Event] = None,
+    ) -> dict[str, str]:
+        """Play a named sound event, checking character-specific audio first, then falling back to default.
 
-    def play_event(self, sound_key: str, *, blocking: bool = False) -> dict[str, str]:
-        """Play a named sound event, checking character-specific audio first, then falling back to default."""
-        filename = SOUND_FILES.get(sound_key)
-        if filename is None:
+        ``done`` is set once playback ends, or straight away if nothing plays.
+        """
+        sound = self._tables[0].get(sound_key)
+        if sound is None:
+            if done is not None:
+                done.set()
             return {
                 "status": "error",
                 "reason": f"Unknown sound key '{sound_key}'",
             }
-        return self._play_file(filename, blocking=blocking)
+        return self._play(sound, blocking=blocking, done=done)
 
     def handle_function_call(self, function_name: str) -> dict[str, str]:
-        """Map Gemini function call name to sound key and play corresponding audio."""
-        sound_key = FUNCTION_SOUND_MAP.get(function_name)
-        if sound_key is None:
+        """Map Gemini function call name to its preloaded sound and play it."""
+        sound = self._tables[1].get(function_name)
+        if sound is None:
             return {
                 "status": "error",
                 "reason": f"Unsupported function '{function_name}'",
             }
-        return self.play_event(sound_key)
-
-    def _play_file(self, filename: str, *, blocking: bool) -> dict[str, str]:
-        # Try character-specific audio first, fall back to root assets
-        if self._character_audio_subdir:
-            char_path = self._assets_dir / self._character_audio_subdir / filename
-            if char_path.exists():
-                path = char_path
-            else:
-                path = self._assets_dir / filename
-        else:
-            path = self._assets_dir / filename
-
-        if not path.exists():
+        return self._play(sound, blocking=False)
+
+    def _load_tables(self, subdir: str) -> None:
+        tables = self._tables_for(subdir)
+        with self._tables_lock:
+            self._tables_by_subdir[subdir] = tables
+            if self._subdir == subdir:
+                self._tables = tables
+
+    def _tables_for(self, subdir: str) -> _SoundTables:
+        """Build the lookup tables for a character, reading only its own files."""
+        if not subdir:
+            return self._shared_tables
+        by_key = {}
+        for sound_key, shared in self._shared.items():
+            filename = shared.filename
+            sound = self._load(self._assets_dir / subdir / filename, filename)
+            by_key[sound_key] = shared if sound.data is None else sound
+        return self._build_tables(by_key)
+
+    @staticmethod
+    def _build_tables(by_key: Dict[str, _Sound]) -> _SoundTables:
+        by_function = {
+            function_name: by_key[sound_key]
+            for function_name, sound_key in FUNCTION_SOUND_MAP.items()
+        }
+        return by_key, by_function
+
+    def _load(self, path: Path, filename: str) -> _Sound:
+        """Read and decode one audio file; missing or unreadable files give no data."""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return _Sound(filename, None)
+        if not data:  # empty placeholder file, treat as missing
+            return _Sound(filename, None)
+        if _BACKEND is None:
+            return _Sound(filename, data)
+        try:
+            return _Sound(filename, _BACKEND.prepare(data))
+        except Exception as exc:  # pragma: no cover - corrupt or empty asset
+            print(f"[Audio] Could not decode {path}: {exc}", file=sys.stderr)
+        return _Sound(filename, None)
+
+    def _play(
+        self,
+        sound: _Sound,
+        *,
+        blocking: bool,
+        done: Optional[threading.Event] = None,
+    ) -> dict[str, str]:
+        if sound.data is None or _BACKEND is None:
+            if done is not None:
+                done.set()
+        if sound.data is None:
             return {
                 "status": "error",
-                "reason": f"Missing audio asset '{filename}'",
+                "reason": f"Missing audio asset '{sound.filename}'",
             }
 
-        with self._lock:
-            if winsound:  # Windows playback (async when requested)
-                flags = winsound.SND_FILENAME
-                if not blocking:
-                    flags |= winsound.SND_ASYNC
-                winsound.PlaySound(str(path), flags)
-                return {
-                    "status": "played",
-                    "file": filename,
-                    "platform": sys.platform,
-                    "blocking": "yes" if blocking else "no",
-                }
+        if _BACKEND is None:
             return {
                 "status": "unsupported",
-                "file": filename,
+                "file": sound.filename,
                 "platform": sys.platform,
                 "blocking": "yes" if blocking else "no",
             }
 
+        self._ensure_worker()
+        if done is None and blocking:
+            done = threading.Event()
+        try:
+            self._queue.put_nowait(_PlaybackJob(sound.data, done))
+        except queue.Full:
+            if done is not None:
+                done.set()
+            return {
+                "status": "error",
+                "reason": f"Audio queue full, dropped '{sound.filename}'",
+            }
+        if blocking:
+            done.wait()
+        return {
+            "status": "played",
+            "file": sound.filename,
+            "platform": sys.platform,
+            "blocking": "yes" if blocking else "no",
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_guard:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run_worker, name="baldi-audio", daemon=True
+                )
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        # Playing synchronously here keeps callers (Tk loop, tool dispatch)
+        # unblocked and lets every cue come from memory: winsound refuses
+        # SND_MEMORY combined with SND_ASYNC.
+        while True:
+            job = self._queue.get()
+            try:
+                _BACKEND.play(job.data)
+            except Exception as exc:  # pragma: no cover - playback is best effort
+                print(f"[Audio] Playback failed: {exc}", file=sys.stderr)
+            finally:
+                if job.done is not None:
+                    job.done.set()
+
 
 _AUDIO_MANAGER: Optional[AudioManager] = None
 
 
-def get_audio_manager() -> AudioManager:
-    """Return a process-wide audio manager, initialising it on first use."""
+def get_audio_manager(character_audio_subdir: Optional[str] = None) -> AudioManager:
+    """Return a process-wide audio manager, initialising it on first use.
+
+    ``character_audio_subdir``, when given, selects the character's audio folder.
+    """
     global _AUDIO_MANAGER
     if _AUDIO_MANAGER is None:
-        assets_root = Path(__file__).resolve().parents[2] / "assets"
-        _AUDIO_MANAGER = AudioManager(assets_root)
+        _AUDIO_MANAGER = AudioManager(_ASSETS_DIR, character_audio_subdir or "")
+    elif character_audio_subdir is not None:
+        _AUDIO_MANAGER.character_audio_subdir = character_audio_subdir
     return _AUDIO_MANAGER
 
 
@@ -1,13 +1,88 @@
 """Character selection dialog UI."""
 
+import struct
 import tkinter as tk
-from tkinter import ttk
-from typing import Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
 from pathlib import Path
-from PIL import Image, ImageTk
 
 from .characters import CHARACTERS, CharacterConfig
 
+if TYPE_CHECKING:  # Pillow is imported on first thumbnail load
+    from PIL import Image, ImageTk
+
+
+_ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+THUMBNAIL_SIZE = (150, 150)
+
+# Header of the raw thumbnail cache: width, height, then RGBA pixels
+_RAW_HEADER = struct.Struct("<HH")
+
+def _thumbnail_photo(root: tk.Misc, pil_image: "Image.Image") -> "ImageTk.PhotoImage":
+    """Convert a decoded thumbnail to a PhotoImage; must run on the Tk thread."""
+    from PIL import ImageTk
+
+    return ImageTk.PhotoImage(pil_image, master=root)
+
+
+def _load_thumbnail_image(image_path: Path) -> "Image.Image":
+    """Decode a thumbnail-sized RGBA image, preferring the cheapest cached form."""
+    from PIL import Image
+
+    raw_path = raw_thumbnail_path(image_path)
+    pil_image = _read_raw_thumbnail(raw_path, image_path)
+    if pil_image is not None:
+        return pil_image
+
+    presized_path = presized_thumbnail_path(image_path)
+    if presized_path.exists():
+        # Shipped at display size by scripts/generate_thumbnails.py
+        pil_image = Image.open(presized_path)
+    else:
+        pil_image = Image.open(image_path)
+        # Use thumbnail to maintain aspect ratio and fit within the card
+        pil_image.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+    pil_image = pil_image.convert("RGBA")
+    _write_raw_thumbnail(raw_path, pil_image)
+    return pil_image
+
+
+def _read_raw_thumbnail(raw_path: Path, source_path: Path) -> Optional["Image.Image"]:
+    """Load pixels written by _write_raw_thumbnail, or None if missing or stale."""
+    from PIL import Image
+
+    try:
+        if raw_path.stat().st_mtime < source_path.stat().st_mtime:
+            return None
+        data = raw_path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < _RAW_HEADER.size:
+        return None
+    width, height = _RAW_HEADER.unpack_from(data)
+    pixels = memoryview(data)[_RAW_HEADER.size:]
+    if len(pixels) != width * height * 4:
+        return None
+    return Image.frombytes("RGBA", (width, height), pixels)
+
+
+def _write_raw_thumbnail(raw_path: Path, image: "Image.Image") -> None:
+    try:
+        raw_path.write_bytes(_RAW_HEADER.pack(*image.size) + image.tobytes())
+    except OSError:
+        pass  # Read-only install; the next run decodes again
+
+
+def raw_thumbnail_path(image_path: Path) -> Path:
+    """Location of the uncompressed RGBA thumbnail cache for a character image."""
+    return image_path.with_name(f"{image_path.stem}_{THUMBNAIL_SIZE[0]}.rgba")
+
+
+def presized_thumbnail_path(image_path: Path) -> Path:
+    """Location of the pre-resized WebP thumbnail for a character image."""
+    return image_path.with_name(f"{image_path.stem}_{THUMBNAIL_SIZE[0]}.webp")
+
 
 class CharacterSelectorDialog:
     """Modal dialog for selecting a character persona."""
@@ -23,6 +98,12 @@ class CharacterSelectorDialog:
         self.current_character_id = current_character_id
         self.selected_character: Optional[CharacterConfig] = None
         self.image_refs = []  # Keep references to prevent garbage collection
+        # Thumbnails still decoding off-thread: (future, label, path, character)
+        self._pending_images: List[
+            Tuple["Future[Image.Image]", tk.Label, Path, CharacterConfig]
+        ] = []
+        # One per card; un-highlights it so a reopened dialog starts clean
+        self._hover_resets: List[Callable[[], None]] = []
 
         # Create toplevel dialog
         self.dialog = tk.Toplevel(parent)
@@ -44,6 +125,10 @@ class CharacterSelectorDialog:
         self.dialog.configure(bg=bg_color)
         self.dialog.resizable(False, False)
 
+        # The dialog is hidden rather than destroyed so it can be reopened cheaply
+        self._hidden = tk.BooleanVar(master=self.dialog, value=False)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._hide)
+
         # Create UI
         self._create_ui()
 
@@ -80,21 +165,46 @@ class CharacterSelectorDialog:
             grid_container.grid_rowconfigure(i, weight=1)
             grid_container.grid_columnconfigure(i, weight=1)
 
-        # Create character cards
+        # Create character cards; their images decode in parallel
+        # (Pillow releases the GIL while decoding) and are attached as they finish.
         character_list = list(CHARACTERS.values())
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=len(character_list), thread_name_prefix="baldi-thumbs"
+        )
         for idx, character in enumerate(character_list):
             row = idx // 2
             col = idx % 2
             card = self._create_character_card(grid_container, character)
             card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
+        # Queued decodes still run; the pool's threads exit once they are done.
+        self._decode_pool.shutdown(wait=False)
+        if self._pending_images:
+            self.dialog.after(15, self._attach_decoded_images)
+
+    def _attach_decoded_images(self) -> None:
+        """Poll decode futures from the Tk thread and show finished thumbnails."""
+        still_pending = []
+        for future, icon_label, image_path, character in self._pending_images:
+            if not future.done():
+                still_pending.append((future, icon_label, image_path, character))
+                continue
+            try:
+                photo = _thumbnail_photo(self.parent, future.result())
+            except Exception as e:
+                print(f"Warning: Could not load image for {character.name}: {e}")
+                continue
+            self.image_refs.append(photo)  # Keep reference
+            icon_label.configure(image=photo)
+        self._pending_images = still_pending
+        if still_pending and self.is_alive():
+            self.dialog.after(15, self._attach_decoded_images)
 
     def _load_character_image(
         self, parent: tk.Frame, character: CharacterConfig, card_bg: str
     ) -> tk.Label:
         """Load character's thinking image, trying both .png and .webp extensions."""
         # Get the path to the thinking image, try both .png and .webp
-        assets_dir = Path(__file__).parent.parent.parent / "assets"
-        base_path = assets_dir / character.thinking_path
+        base_path = _ASSETS_DIR / character.thinking_path
 
         # Try to find the image with either .png or .webp extension
         image_path = None
@@ -117,37 +227,20 @@ class CharacterSelectorDialog:
             # If neither exists, use the original path for error message
             image_path = base_path
 
-        try:
-            # Load and resize the image (maintain aspect ratio)
-            pil_image = Image.open(image_path)
-            # Use thumbnail to maintain aspect ratio and fit within 150x150
-            pil_image.thumbnail((150, 150), Image.Resampling.LANCZOS)
-
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(pil_image)
-            self.image_refs.append(photo)  # Keep reference
+        # Empty placeholder; doubles as the fallback if the image cannot be loaded
+        icon_label = tk.Label(
+            parent,
+            text="",  # <-- Removed character initial
+            font=("Segoe UI", 48, "bold"),
+            fg="#38bdf8",
+            bg="#475569",
+        )
+        icon_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
 
-            # Create label with image
-            icon_label = tk.Label(
-                parent,
-                image=photo,
-                bg="#475569",
-            )
-            icon_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-
-            return icon_label
-        except Exception as e:
-            # Fallback to text initial if image loading fails
-            print(f"Warning: Could not load image for {character.name}: {e}")
-            icon_label = tk.Label(
-                parent,
-                text="",  # <-- Removed character initial
-                font=("Segoe UI", 48, "bold"),
-                fg="#38bdf8",
-                bg="#475569",
-            )
-            icon_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-            return icon_label
+        # Decode off the Tk thread; the dialog itself is reused between selections
+        future = self._decode_pool.submit(_load_thumbnail_image, image_path)
+        self._pending_images.append((future, icon_label, image_path, character))
+        return icon_label
 
     def _create_character_card(
         self, parent: tk.Frame, character: CharacterConfig
@@ -210,19 +303,27 @@ class CharacterSelectorDialog:
         def on_card_click(event=None):
             self._select_character(character)
 
+        # Widgets recoloured on hover; extend this tuple if name_label/indicator return
+        hover_widgets = (card, inner_frame)
+        hover_state = [False]
+
+        def set_hover(hovered: bool) -> None:
+            # Enter/Leave fire for every child the pointer crosses; only touch
+            # Tk when the card's hover state actually changes.
+            if hover_state[0] == hovered:
+                return
+            hover_state[0] = hovered
+            bg = card_hover_bg if hovered else card_bg
+            for widget in hover_widgets:
+                widget.configure(bg=bg)
+
         def on_enter(event):
-            card.configure(bg=card_hover_bg)
-            inner_frame.configure(bg=card_hover_bg)
-            # name_label.configure(bg=card_hover_bg)
-            # if indicator:
-            #     indicator.configure(bg=card_hover_bg)
+            set_hover(True)
 
         def on_leave(event):
-            card.configure(bg=card_bg)
-            inner_frame.configure(bg=card_bg)
-            # name_label.configure(bg=card_bg)
-            # if indicator:
-            #     indicator.configure(bg=card_bg)
+            set_hover(False)
+
+        self._hover_resets.append(lambda: set_hover(False))
 
         # Bind events to all elements for better UX
         widgets_to_bind = [card, inner_frame, image_container, icon_label]
@@ -239,12 +340,42 @@ class CharacterSelectorDialog:
     def _select_character(self, character: CharacterConfig) -> None:
         """Handle character selection."""
         self.selected_character = character
-        self.dialog.destroy()
+        self._hide()
         self.on_select(character)
 
+    def _hide(self) -> None:
+        # No <Leave> arrives once withdrawn, so drop the hovered card's highlight
+        for reset_hover in self._hover_resets:
+            reset_hover()
+        self.dialog.grab_release()
+        self.dialog.withdraw()
+        self._hidden.set(True)
+
+    def is_alive(self) -> bool:
+        try:
+            return bool(self.dialog.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def reset(
+        self,
+        on_select: Callable[[CharacterConfig], None],
+        current_character_id: str,
+    ) -> None:
+        """Prepare a previously shown dialog for another selection."""
+        self.on_select = on_select
+        self.current_character_id = current_character_id
+        self.selected_character = None
+
     def show(self) -> None:
-        """Show the dialog and wait for user interaction."""
-        self.dialog.wait_window()
+        """Show the dialog and wait until a character is picked or it is closed."""
+        self._hidden.set(False)
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+        self.dialog.wait_variable(self._hidden)
+
+
+_SELECTOR: Optional[CharacterSelectorDialog] = None
 
 
 def show_character_selector(
@@ -253,7 +384,14 @@ def show_character_selector(
     current_character_id: str = "baldi",
 ) -> None:
     """Display modal dialog for character selection and invoke callback when chosen."""
-    dialog = CharacterSelectorDialog(parent, on_select, current_character_id)
+    global _SELECTOR
+    dialog = _SELECTOR
+    if dialog is None or dialog.parent is not parent or not dialog.is_alive():
+        dialog = _SELECTOR = CharacterSelectorDialog(
+            parent, on_select, current_character_id
+        )
+    else:
+        dialog.reset(on_select, current_character_id)
     dialog.show()
 
 
@@ -1,84 +1,46 @@
 """Character definitions and configuration for the teaching assistant."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
 
 
-@dataclass
+PERSONAS_DIR = Path(__file__).resolve().parent / "personas"
+
+
+@functools.lru_cache(maxsize=None)
+def _read_persona(persona_path: str) -> str:
+    return (PERSONAS_DIR / persona_path).read_text(encoding="utf-8").strip()
+
+
+@dataclass(frozen=True)
 class CharacterConfig:
     """Configuration for a single character persona."""
 
+    # Spelled out instead of dataclass(slots=True), which needs Python 3.10.
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "persona_path",
+        "avatar_path",
+        "thinking_path",
+        "audio_dir",
+    )
+
     id: str
     name: str
     description: str
-    persona_prompt: str
+    persona_path: str
     avatar_path: str
     thinking_path: str
     audio_dir: str
 
-
-# Character persona prompts
-BALDI_PERSONA = (
-    "You are Baldi, the strict but eccentric math teacher from the game "
-    "'Baldi's Basics'. You teach with upbeat enthusiasm, occasional fourth-wall "
-    "breaks, and a penchant for pop quizzes. Balance playful scolding with genuine "
-    "encouragement, keep explanations accessible for middle school students, and "
-    "sprinkle in light references to rulers, notebooks, or school hallways. Never "
-    "threaten the learner; instead, motivate them to try again with humor and "
-    "cartoonish charm. You can trigger classroom sound effects via function calls: "
-    "use `play_great_job_sound` to reward correct work, `play_wrong_sound` to gently "
-    "call out mistakes, and `play_mad_sounds` sparingly for comedic frustration. "
-    "Always finish with a clear, text explanation after any sound cue. "
-    "IMPORTANT: When writing mathematical expressions, NEVER use LaTeX notation "
-    "(like $x^2$ or $$\\frac{a}{b}$$). Instead, use plain ASCII text: write x^2, "
-    "a/b, sqrt(x), etc. Keep all math in simple text format that any student can type."
-)
-
-LEBRON_PERSONA = (
-    "You are LeBron James, the legendary basketball player turned teacher. You bring "
-    "the same dedication and leadership from the court to the classroom. You teach with "
-    "motivational energy, using basketball analogies and sports metaphors to make concepts "
-    "click. You're supportive and encouraging, treating every student like a teammate. "
-    "You emphasize practice, persistence, and 'leaving it all on the court.' Keep lessons "
-    "accessible for middle school students and remind them that 'nothing is given, everything "
-    "is earned.' You can trigger sound effects via function calls: use `play_great_job_sound` "
-    "for excellent work, `play_wrong_sound` for mistakes (with encouragement to get back in "
-    "the game), and `play_mad_sounds` when frustration builds. Always follow up sound effects "
-    "with motivational text. "
-    "IMPORTANT: When writing mathematical expressions, NEVER use LaTeX notation "
-    "(like $x^2$ or $$\\frac{a}{b}$$). Instead, use plain ASCII text: write x^2, "
-    "a/b, sqrt(x), etc. Keep all math in simple text format that any student can type."
-)
-
-STEVE_PERSONA = (
-    "You are Steve from Minecraft, the brave and creative builder exploring endless worlds. "
-    "You teach with an adventurous spirit, relating lessons to crafting, mining, building, "
-    "and survival. You're resourceful and encouraging, showing students how to 'gather resources' "
-    "(knowledge) and 'craft solutions' to problems. You emphasize creativity, perseverance through "
-    "challenges, and learning from failures (like respawning after defeat). Keep explanations "
-    "accessible for middle school students using Minecraft concepts. You can trigger sound effects: "
-    "use `play_great_job_sound` for achievements, `play_wrong_sound` for setbacks (with encouragement "
-    "to try again), and `play_mad_sounds` when facing tough 'mobs' (problems). Always follow sounds "
-    "with clear text explanations. "
-    "IMPORTANT: When writing mathematical expressions, NEVER use LaTeX notation "
-    "(like $x^2$ or $$\\frac{a}{b}$$). Instead, use plain ASCII text: write x^2, "
-    "a/b, sqrt(x), etc. Keep all math in simple text format that any student can type."
-)
-
-VILLAGER_PERSONA = (
-    "You are a Minecraft Villager, the simple and relaxed NPC from the village. You teach in a "
-    "calm, straightforward manner with minimal fuss. Your explanations are simple and to the point, "
-    "occasionally punctuated with 'huh' or 'hmm' sounds. You're patient and unhurried, never "
-    "overcomplicated. You relate concepts to village life: trading, farming, building, and simple "
-    "routines. Keep lessons accessible for middle school students with a relaxed, no-pressure "
-    "approach. You can trigger sound effects: use `play_great_job_sound` for good work, "
-    "`play_wrong_sound` for mistakes (no big deal, huh?), and `play_mad_sounds` rarely, only "
-    "when truly puzzled. Always follow sounds with simple text, huh? "
-    "IMPORTANT: When writing mathematical expressions, NEVER use LaTeX notation "
-    "(like $x^2$ or $$\\frac{a}{b}$$). Instead, use plain ASCII text: write x^2, "
-    "a/b, sqrt(x), etc. Keep all math in simple text format that any student can type."
-)
+    @property
+    def persona_prompt(self) -> str:
+        """Persona text, read from ``personas/`` the first time it is needed."""
+        return _read_persona(self.persona_path)
 
 
 # Character configurations
@@ -87,7 +49,7 @@ CHARACTERS: Dict[str, CharacterConfig] = {
         id="baldi",
         name="Baldi",
         description="Objective, strict, intense",
-        persona_prompt=BALDI_PERSONA,
+        persona_path="baldi.txt",
         avatar_path="characters/baldi/character.webp",
         thinking_path="characters/baldi/thinking.png",
         audio_dir="characters/baldi",
@@ -96,7 +58,7 @@ CHARACTERS: Dict[str, CharacterConfig] = {
         id="lebron",
         name="LeBron James",
         description="Basketball themed lessons, supportive",
-        persona_prompt=LEBRON_PERSONA,
+        persona_path="lebron.txt",
         avatar_path="characters/lebron_james/character.webp",
         thinking_path="characters/lebron_james/thinking.png",
         audio_dir="characters/lebron_james",
@@ -105,7 +67,7 @@ CHARACTERS: Dict[str, CharacterConfig] = {
         id="steve",
         name="Steve",
         description="Creative, Adventurous, Brave, Perseverant",
-        persona_prompt=STEVE_PERSONA,
+        persona_path="steve.txt",
         avatar_path="characters/steve/character.webp",
         thinking_path="characters/steve/thinking.png",
         audio_dir="characters/steve",
@@ -114,7 +76,7 @@ CHARACTERS: Dict[str, CharacterConfig] = {
         id="villager",
         name="Minecraft Villager",
         description="Simple, Relaxed, huh",
-        persona_prompt=VILLAGER_PERSONA,
+        persona_path="villager.txt",
         avatar_path="characters/villager/character.webp",
         thinking_path="characters/villager/thinking.png",
         audio_dir="characters/villager",
@@ -124,9 +86,10 @@ CHARACTERS: Dict[str, CharacterConfig] = {
 
 def get_character(character_id: str) -> CharacterConfig:
     """Get character configuration by ID."""
-    if character_id not in CHARACTERS:
-        raise ValueError(f"Unknown character ID: {character_id}")
-    return CHARACTERS[character_id]
+    try:
+        return CHARACTERS[character_id]
+    except KeyError:
+        raise ValueError(f"Unknown character ID: {character_id}") from None
 
 
 def get_default_character() -> CharacterConfig:
@@ -134,6 +97,22 @@ def get_default_character() -> CharacterConfig:
     return CHARACTERS["baldi"]
 
 
+# Legacy module attributes, resolved lazily so unused personas are never read.
+_LEGACY_PERSONAS = {
+    "BALDI_PERSONA": "baldi",
+    "LEBRON_PERSONA": "lebron",
+    "STEVE_PERSONA": "steve",
+    "VILLAGER_PERSONA": "villager",
+}
+
+
+def __getattr__(name: str) -> str:
+    character_id = _LEGACY_PERSONAS.get(name)
+    if character_id is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return CHARACTERS[character_id].persona_prompt
+
+
 __all__ = [
     "CharacterConfig",
     "CHARACTERS",
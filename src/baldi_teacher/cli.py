@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
 from dataclasses import replace
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
 from .config import AppConfig
 from .gemini_client import GeminiChatClient
 from .prompting import BALDI_PERSONA_PROMPT
 from .teacher_bot import TeacherBot
-from .image_overlay import ImageOverlay
+
+if TYPE_CHECKING:
+    from .image_overlay import ImageOverlay
 
 
 def run_cli(argv: Optional[Iterable[str]] = None) -> None:
@@ -64,7 +67,7 @@ def run_cli(argv: Optional[Iterable[str]] = None) -> None:
             overlay.stop()
 
 
-def _parse_args(argv: Optional[Iterable[str]]) -> argparse.Namespace:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Command-line Baldi teacher chatbot powered by Gemini."
     )
@@ -137,7 +140,14 @@ def _parse_args(argv: Optional[Iterable[str]]) -> argparse.Namespace:
         action="store_true",
         help="Disable the Baldi overlay window.",
     )
-    return parser.parse_args(list(argv) if argv is not None else None)
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def _parse_args(argv: Optional[Iterable[str]]) -> argparse.Namespace:
+    return _PARSER.parse_args(list(argv) if argv is not None else None)
 
 
 def _build_config(args: argparse.Namespace) -> AppConfig:
@@ -158,6 +168,7 @@ def _build_config(args: argparse.Namespace) -> AppConfig:
     return config
 
 
+@functools.lru_cache(maxsize=None)
 def _load_persona(persona_path: Optional[Path]) -> str:
     if persona_path is None:
         return BALDI_PERSONA_PROMPT
@@ -165,9 +176,10 @@ def _load_persona(persona_path: Optional[Path]) -> str:
 
 
 def _printf(speaker: str, message: str) -> None:
-    for line in message.splitlines():
-        if line:
-            print(f"{speaker}> {line}")
+    sys.stdout.write(
+        "".join(f"{speaker}> {line}\n" for line in message.splitlines() if line)
+    )
+    sys.stdout.flush()
 
 
 def _start_overlay(
@@ -177,6 +189,8 @@ def _start_overlay(
     max_height: Optional[int],
     transparent: Optional[bool],
 ) -> Optional[ImageOverlay]:
+    from .image_overlay import ImageOverlay  # Tk + Pillow only when the overlay is on
+
     max_w = max_width if max_width and max_width > 0 else None
     max_h = max_height if max_height and max_height > 0 else None
     overlay = ImageOverlay(
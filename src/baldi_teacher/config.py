@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import os
+import re
 from dataclasses import dataclass
 from typing import Optional
 from pathlib import Path
@@ -9,6 +11,10 @@ from pathlib import Path
 DEFAULT_MODEL = "gemini-flash-latest"
 DEFAULT_HISTORY_LIMIT = 10
 _ENV_LOADED = False
+# KEY=VALUE per line; blank, comment, and "="-less lines never match.
+_ENV_LINE_PATTERN = re.compile(
+    r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
 
 
 @dataclass(frozen=True)
@@ -26,33 +32,44 @@ class AppConfig:
     def from_env(
         cls, *, prefix: str = "BALDI_", api_key: Optional[str] = None
     ) -> "AppConfig":
-        """Create configuration from environment variables."""
-        _ensure_env_loaded()
-        api_key = (
-            api_key
-            or os.getenv(f"{prefix}GEMINI_API_KEY")
-            or os.getenv("GEMINI_API_KEY")
-        )
-        if not api_key:
-            raise RuntimeError(
-                "Missing Gemini API key. Set BALDI_GEMINI_API_KEY or GEMINI_API_KEY."
-            )
-
-        model = os.getenv(f"{prefix}MODEL") or DEFAULT_MODEL
-        max_turn_history = _get_int_env(f"{prefix}MAX_TURN_HISTORY", DEFAULT_HISTORY_LIMIT)
-        temperature = _get_float_env(f"{prefix}TEMPERATURE", 0.8)
-        top_p = _get_float_env(f"{prefix}TOP_P", 0.95)
-        top_k = _get_int_env(f"{prefix}TOP_K", 40)
-
-        return cls(
-            api_key=api_key,
-            model=model,
-            max_turn_history=max_turn_history,
-            temperature=temperature,
-            top_p=top_p,
-            top_k=top_k,
+        """Create configuration from environment variables.
+
+        The parsed result is memoized per ``(prefix, api_key)`` for the life of
+        the process, so later environment changes are not picked up.
+        """
+        return _from_env_cached(cls, prefix, api_key)
+
+
+@functools.lru_cache(maxsize=8)
+def _from_env_cached(
+    cls: type[AppConfig], prefix: str, api_key: Optional[str]
+) -> AppConfig:
+    _ensure_env_loaded()
+    api_key = (
+        api_key
+        or os.getenv(f"{prefix}GEMINI_API_KEY")
+        or os.getenv("GEMINI_API_KEY")
+    )
+    if not api_key:
+        raise RuntimeError(
+            "Missing Gemini API key. Set BALDI_GEMINI_API_KEY or GEMINI_API_KEY."
         )
 
+    model = os.getenv(f"{prefix}MODEL") or DEFAULT_MODEL
+    max_turn_history = _get_int_env(f"{prefix}MAX_TURN_HISTORY", DEFAULT_HISTORY_LIMIT)
+    temperature = _get_float_env(f"{prefix}TEMPERATURE", 0.8)
+    top_p = _get_float_env(f"{prefix}TOP_P", 0.95)
+    top_k = _get_int_env(f"{prefix}TOP_K", 40)
+
+    return cls(
+        api_key=api_key,
+        model=model,
+        max_turn_history=max_turn_history,
+        temperature=temperature,
+        top_p=top_p,
+        top_k=top_k,
+    )
+
 
 def _get_int_env(name: str, default: int) -> int:
     raw = os.getenv(name)
@@ -81,12 +98,8 @@ def _ensure_env_loaded() -> None:
 
     env_path = Path(__file__).resolve().parents[2] / ".env"
     if env_path.exists():
-        for line in env_path.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if not stripped or stripped.startswith("#"):
-                continue
-            if "=" not in stripped:
-                continue
-            key, value = map(str.strip, stripped.split("=", 1))
+        # setdefault in file order: the first occurrence of a key wins.
+        text = env_path.read_text(encoding="utf-8")
+        for key, value in _ENV_LINE_PATTERN.findall(text):
             os.environ.setdefault(key, value)
     _ENV_LOADED = True
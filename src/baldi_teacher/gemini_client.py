@@ -1,27 +1,130 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Iterator, Sequence
 
 from .config import AppConfig
 from .audio import get_audio_manager
 from .types import ChatMessage
 
-try:
-    import google.generativeai as genai
-except ImportError as exc:  # pragma: no cover - helps users diagnose missing deps
-    raise RuntimeError(
-        "google-generativeai is required. Install with 'pip install google-generativeai'."
-    ) from exc
+@lru_cache(maxsize=None)
+def _load_sdk() -> tuple[Any, Any]:
+    """Import ``google.generativeai`` and its proto types on first use.
+
+    The SDK pulls in a large protobuf tree, so importing it lazily keeps
+    ``--help`` and argument parsing fast.
+    """
+    try:
+        import google.generativeai as genai
+        from google.ai import generativelanguage as glm
+    except ImportError as exc:  # pragma: no cover - helps users diagnose missing deps
+        raise RuntimeError(
+            "google-generativeai is required. Install with 'pip install google-generativeai'."
+        ) from exc
+    return genai, glm
+
+
+_MAX_INLINE_PDF_BYTES = 20 * 1024 * 1024
+
+_CONFIGURED_API_KEY: str | None = None
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure the SDK once per key so the shared gRPC channel stays open.
+
+    ``genai.configure`` throws away the SDK's cached service clients, so calling
+    it for every ``GeminiChatClient`` would reconnect on each character switch.
+    """
+    global _CONFIGURED_API_KEY
+    if _CONFIGURED_API_KEY == api_key:
+        return
+    genai, _ = _load_sdk()
+    # gRPC multiplexes every request over one long-lived HTTP/2 connection.
+    genai.configure(api_key=api_key, transport="grpc")
+    _CONFIGURED_API_KEY = api_key
+
+
+@lru_cache(maxsize=8)
+def _load_pdf_bytes(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """Read a PDF once per (path, mtime, size); edits on disk change the key."""
+    return _read_file_unbuffered(path_str, size)
+
+
+@lru_cache(maxsize=64)
+def _resolve_attachment(path: Path) -> Path:
+    """Resolve a bookshelf path once; the shelf re-sends the same paths each turn."""
+    try:
+        return path.resolve()
+    except OSError:
+        return path
+
+
+def _read_file_unbuffered(path: str | Path, size: int = -1) -> bytes:
+    """Read a whole file through raw ``FileIO`` without an extra buffer layer."""
+    with open(path, "rb", buffering=0) as handle:
+        data = handle.read(size)
+        if size < 0 or len(data) >= size:
+            return data
+        # Raw reads may return fewer bytes than asked for; finish the file.
+        return data + handle.readall()
+
+
+# Function-calling spec shared by every client; the names match FUNCTION_SOUND_MAP.
+_TOOL_DECLARATIONS = [
+    {
+        "function_declarations": [
+            {
+                "name": "play_great_job_sound",
+                "description": (
+                    "Play Baldi's celebratory 'great job' sound to reward "
+                    "correct answers."
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                },
+            },
+            {
+                "name": "play_wrong_sound",
+                "description": (
+                    "Play Baldi's disappointed 'wrong answer' buzzer when a "
+                    "student makes a mistake."
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                },
+            },
+            {
+                "name": "play_mad_sounds",
+                "description": (
+                    "Play Baldi's comedic frustrated muttering when he wants "
+                    "to emphasise a point."
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {},
+                },
+            },
+        ]
+    }
+]
+
+_TOOL_CONFIG = {
+    "function_calling_config": {
+        "mode": "AUTO",
+    }
+}
 
 
 class GeminiChatClient:
     """Thin wrapper around the Gemini chat API."""
 
     def __init__(self, config: AppConfig, system_instruction: str) -> None:
-        from google.ai import generativelanguage as glm
-
-        genai.configure(api_key=config.api_key)
+        genai, glm = _load_sdk()
+        _configure_genai(config.api_key)
         self._model = genai.GenerativeModel(
             model_name=config.model,
             system_instruction=system_instruction,
@@ -30,53 +133,14 @@ class GeminiChatClient:
                 top_p=config.top_p,
                 top_k=config.top_k,
             ),
-            tools=[
-                {
-                    "function_declarations": [
-                        {
-                            "name": "play_great_job_sound",
-                            "description": (
-                                "Play Baldi's celebratory 'great job' sound to reward "
-                                "correct answers."
-                            ),
-                            "parameters": {
-                                "type": "object",
-                                "properties": {},
-                            },
-                        },
-                        {
-                            "name": "play_wrong_sound",
-                            "description": (
-                                "Play Baldi's disappointed 'wrong answer' buzzer when a "
-                                "student makes a mistake."
-                            ),
-                            "parameters": {
-                                "type": "object",
-                                "properties": {},
-                            },
-                        },
-                        {
-                            "name": "play_mad_sounds",
-                            "description": (
-                                "Play Baldi's comedic frustrated muttering when he wants "
-                                "to emphasise a point."
-                            ),
-                            "parameters": {
-                                "type": "object",
-                                "properties": {},
-                            },
-                        },
-                    ]
-                }
-            ],
-            tool_config={
-                "function_calling_config": {
-                    "mode": "AUTO",
-                }
-            },
+            tools=_TOOL_DECLARATIONS,
+            tool_config=_TOOL_CONFIG,
         )
         self._glm = glm
         self._audio_manager = get_audio_manager()
+        # Parts for the last bookshelf, keyed by each file's path, mtime and size.
+        self._last_attachment_key: tuple[tuple[str, int, int], ...] | None = None
+        self._last_attachment_parts: tuple[list[object], list[str]] | None = None
 
     def generate_reply(
         self,
@@ -86,23 +150,7 @@ class GeminiChatClient:
     ) -> str:
         """Generate AI response from message history, handling tool calls and file attachments."""
         glm = self._glm
-        contents = [message.as_gemini_content() for message in messages]
-        if attachments:
-            attachment_parts, attachment_labels = self._prepare_attachments(attachments)
-            if attachment_parts:
-                if contents and getattr(contents[-1], "role", None) == "user":
-                    target_content = contents[-1]
-                else:
-                    # Ensure attachments live on a user turn so Gemini can attribute them.
-                    target_content = glm.Content(role="user", parts=[])
-                    contents.append(target_content)
-                existing_parts = list(getattr(target_content, "parts", []))
-                intro_text = "Bookshelf documents attached:\n" + "\n".join(
-                    f"- {label}" for label in attachment_labels
-                )
-                existing_parts.append(glm.Part(text=intro_text))
-                existing_parts.extend(attachment_parts)
-                target_content.parts = existing_parts
+        contents = self._build_contents(messages, attachments)
         # Loop until Gemini returns plain text, replaying any required tool calls.
         while True:
             response = self._model.generate_content(contents, stream=False)
@@ -110,37 +158,28 @@ class GeminiChatClient:
                 raise RuntimeError("No response from Gemini API.")
 
             candidate = response.candidates[0]
-            parts = list(getattr(candidate.content, "parts", []))
-
-            tool_calls = [
-                part.function_call for part in parts if getattr(part, "function_call", None)
-            ]
-            text_fragments = [
-                part.text for part in parts if getattr(part, "text", None)
-            ]
+            # One pass over the raw protobuf parts: a single oneof check per part
+            # is much cheaper than probing proto-plus wrapper attributes.
+            tool_calls = []
+            text_fragments = []
+            for part in glm.Content.pb(candidate.content).parts:
+                kind = part.WhichOneof("data")
+                if kind == "function_call":
+                    tool_calls.append(part.function_call)
+                elif kind == "text" and part.text:
+                    text_fragments.append(part.text)
 
             if tool_calls:
                 if candidate.content:
                     contents.append(candidate.content)
-                for call in tool_calls:
-                    result = self._audio_manager.handle_function_call(call.name)
-                    contents.append(
-                        glm.Content(
-                            role="function",
-                            parts=[
-                                glm.Part(
-                                    function_response=glm.FunctionResponse(
-                                        name=call.name,
-                                        response=result,
-                                    )
-                                )
-                            ],
-                        )
-                    )
+                contents.append(self._answer_tool_calls(tool_calls))
                 # Ask Gemini to continue now that the function response is appended.
                 continue
 
             if text_fragments:
+                if len(text_fragments) == 1:
+                    # Usual case: a single text part needs no join copy.
+                    return text_fragments[0].strip()
                 return "".join(text_fragments).strip()
 
             finish_reason = getattr(candidate, "finish_reason", None)
@@ -148,20 +187,148 @@ class GeminiChatClient:
                 f"Gemini response missing text and tool calls (finish_reason={finish_reason})."
             )
 
+    def stream_reply(
+        self,
+        messages: Sequence[ChatMessage],
+        *,
+        attachments: Sequence[Path] = (),
+    ) -> Iterator[str]:
+        """Like ``generate_reply`` but yield text fragments as Gemini streams them."""
+        glm = self._glm
+        contents = self._build_contents(messages, attachments)
+        while True:
+            response = self._model.generate_content(contents, stream=True)
+            tool_calls = []
+            produced_text = False
+            for chunk in response:
+                if not chunk.candidates:
+                    continue
+                for part in glm.Content.pb(chunk.candidates[0].content).parts:
+                    kind = part.WhichOneof("data")
+                    if kind == "function_call":
+                        tool_calls.append(part.function_call)
+                    elif kind == "text" and part.text:
+                        produced_text = True
+                        yield part.text
+
+            if not response.candidates:
+                raise RuntimeError("No response from Gemini API.")
+            candidate = response.candidates[0]  # Chunks merged by the SDK
+            if tool_calls:
+                if candidate.content:
+                    contents.append(candidate.content)
+                contents.append(self._answer_tool_calls(tool_calls))
+                continue
+
+            if produced_text:
+                return
+
+            finish_reason = getattr(candidate, "finish_reason", None)
+            raise RuntimeError(
+                f"Gemini response missing text and tool calls (finish_reason={finish_reason})."
+            )
+
+    def _build_contents(
+        self,
+        messages: Sequence[ChatMessage],
+        attachments: Sequence[Path],
+    ) -> list[object]:
+        glm = self._glm
+        contents = [message.as_gemini_content() for message in messages]
+        if attachments:
+            attachment_parts, attachment_labels = self._prepare_attachments(attachments)
+            if attachment_labels:
+                if contents and getattr(contents[-1], "role", None) == "user":
+                    # Copy: the cached history Content must not gain attachments.
+                    target_content = glm.Content(
+                        role="user", parts=contents[-1].parts
+                    )
+                    contents[-1] = target_content
+                else:
+                    # Ensure attachments live on a user turn so Gemini can attribute them.
+                    target_content = glm.Content(role="user", parts=[])
+                    contents.append(target_content)
+                intro_text = "Bookshelf documents attached:\n" + "\n".join(
+                    f"- {label}" for label in attachment_labels
+                )
+                # Extend the repeated field in place instead of rebuilding it.
+                target_content.parts.append(glm.Part(text=intro_text))
+                target_content.parts.extend(attachment_parts)
+        return contents
+
+    def _answer_tool_calls(self, tool_calls: Sequence[Any]) -> object:
+        glm = self._glm
+        # handle_function_call only queues the cue on the audio worker, so
+        # every call is dispatched before any sound finishes playing. All
+        # responses go back in one turn, as Gemini expects for parallel calls.
+        return glm.Content(
+            role="function",
+            parts=[
+                glm.Part(
+                    function_response=glm.FunctionResponse(
+                        name=call.name,
+                        response=self._audio_manager.handle_function_call(call.name),
+                    )
+                )
+                for call in tool_calls
+            ],
+        )
+
     def _prepare_attachments(
         self,
         attachments: Sequence[Path],
+    ) -> tuple[list[object], list[str]]:
+        # Stat every file once; the results feed the cache key and the builders.
+        stats: list[os.stat_result | OSError] = []
+        for entry in attachments:
+            try:
+                stats.append(os.stat(entry))
+            except OSError as exc:
+                stats.append(exc)
+        key: tuple[tuple[str, int, int], ...] | None = None
+        if not any(isinstance(stat, OSError) for stat in stats):
+            key = tuple(
+                (str(entry), stat.st_mtime_ns, stat.st_size)
+                for entry, stat in zip(attachments, stats)
+            )
+            if key == self._last_attachment_key:
+                return self._last_attachment_parts
+        result = self._build_attachment_parts(attachments, stats)
+        self._last_attachment_key = key
+        self._last_attachment_parts = result
+        return result
+
+    def _build_attachment_parts(
+        self,
+        attachments: Sequence[Path],
+        stats: Sequence[os.stat_result | OSError],
     ) -> tuple[list[object], list[str]]:
         parts: list[object] = []
         labels: list[str] = []
         errors: list[str] = []
-        for entry in attachments:
+        for entry, stat in zip(attachments, stats):
+            if isinstance(stat, FileNotFoundError):
+                errors.append(f"{entry}: File does not exist.")
+                continue
+            if isinstance(stat, OSError):
+                errors.append(f"{entry}: {stat}")
+                continue
+            path = entry if isinstance(entry, Path) else Path(entry)
+            if path.suffix.lower() == ".pdf" and stat.st_size > _MAX_INLINE_PDF_BYTES:
+                # Skip rather than fail the whole turn; the file is never opened.
+                # The label stays, so every turn's intro part names the skip.
+                print(
+                    f"Warning: Skipping {path.name}: PDF files larger than 20MB "
+                    "cannot be attached inline."
+                )
+                labels.append(f"{path.name} (skipped: larger than 20 MB)")
+                continue
             try:
-                part, label = self._build_attachment_part(Path(entry))
+                file_parts, label = self._build_attachment_part(path, stat)
             except Exception as exc:
                 errors.append(f"{entry}: {exc}")
                 continue
-            parts.append(part)
+            parts.extend(file_parts)
             labels.append(label)
         if errors:
             raise RuntimeError(
@@ -172,43 +339,58 @@ class GeminiChatClient:
     def _build_attachment_part(
         self,
         path: Path,
-    ) -> tuple[object, str]:
-        """Convert a PDF or text file into a Gemini content part with label."""
-        glm = self._glm
-        if not path.exists():
-            raise FileNotFoundError("File does not exist.")
-        suffix = path.suffix.lower()
-        if suffix not in {".pdf", ".txt"}:
+        stat: os.stat_result,
+    ) -> tuple[list[object], str]:
+        """Convert a PDF or text file into Gemini content parts with label."""
+        builder = self._ATTACHMENT_BUILDERS.get(path.suffix.lower())
+        if builder is None:
             raise ValueError(f"Unsupported file type '{path.suffix}'.")
+        return builder(self, _resolve_attachment(path), stat)
+
+    def _build_pdf_part(
+        self,
+        resolved: Path,
+        stat: os.stat_result,
+    ) -> tuple[list[object], str]:
+        glm = self._glm
         try:
-            resolved = path.resolve()
-        except OSError:
-            resolved = path
-
-        if suffix == ".pdf":
-            size = resolved.stat().st_size
-            if size > 20 * 1024 * 1024:
-                raise ValueError("PDF files larger than 20MB cannot be attached inline.")
-            try:
-                data = resolved.read_bytes()
-            except OSError as exc:
-                raise RuntimeError(f"Could not read PDF file: {exc}") from exc
-            part = glm.Part(
-                inline_data=glm.Blob(
-                    mime_type="application/pdf",
-                    data=data,
-                )
+            data = _load_pdf_bytes(str(resolved), stat.st_mtime_ns, stat.st_size)
+        except OSError as exc:
+            raise RuntimeError(f"Could not read PDF file: {exc}") from exc
+        part = glm.Part(
+            inline_data=glm.Blob(
+                mime_type="application/pdf",
+                data=data,
             )
-            label = f"{resolved.name} (PDF)"
-            return part, label
+        )
+        label = f"{resolved.name} (PDF)"
+        return [part], label
 
+    def _build_text_part(
+        self,
+        resolved: Path,
+        stat: os.stat_result,
+    ) -> tuple[list[object], str]:
+        glm = self._glm
         try:
-            text_content = resolved.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            # Fall back to lossy decoding so partially corrupt files still attach.
-            text_content = resolved.read_text(encoding="utf-8", errors="ignore")
+            raw_text = _read_file_unbuffered(resolved, stat.st_size)
         except OSError as exc:
             raise RuntimeError(f"Could not read text file: {exc}") from exc
-        part = glm.Part(text=f"[Text document: {resolved.name}]\n{text_content}")
+        try:
+            text_content = raw_text.decode("utf-8")
+        except UnicodeDecodeError:
+            # Fall back to lossy decoding so partially corrupt files still attach.
+            text_content = raw_text.decode("utf-8", errors="ignore")
+        # Header and body as separate parts so the document text is never copied.
+        file_parts = [
+            glm.Part(text=f"[Text document: {resolved.name}]\n"),
+            glm.Part(text=text_content),
+        ]
         label = f"{resolved.name} (Text)"
-        return part, label
+        return file_parts, label
+
+    # Lower-cased suffix -> builder; one stat result is shared by all of them.
+    _ATTACHMENT_BUILDERS = {
+        ".pdf": _build_pdf_part,
+        ".txt": _build_text_part,
+    }
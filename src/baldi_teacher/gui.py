@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import queue
 import threading
 from dataclasses import replace
 from pathlib import Path
@@ -11,11 +13,13 @@ from .gemini_client import GeminiChatClient
 from .prompting import BALDI_PERSONA_PROMPT
 from .teacher_bot import TeacherBot
 from .gui_view import BaldiTeacherView
-from .audio import get_audio_manager, AudioManager
-from .characters import get_default_character, CharacterConfig
+from .audio import get_audio_manager
+from .characters import CHARACTERS, get_default_character, CharacterConfig
 from .character_selector import show_character_selector
 
 
+_ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
 READY_STATUS = "Ready for the next question."
 WAITING_STATUS = "Baldi is waiting for your question."
 THINKING_STATUS = "Baldi is thinking while he is thinking."
@@ -31,14 +35,8 @@ def run_gui(argv: Optional[Iterable[str]] = None) -> None:
     current_character = get_default_character()
     persona = _load_persona(args.persona)
 
-    # Initialize audio manager with character audio directory
-    assets_root = Path(__file__).resolve().parents[2] / "assets"
-    from .audio import _AUDIO_MANAGER, AudioManager
-    if _AUDIO_MANAGER is None:
-        # Create audio manager with character-specific audio directory
-        import sys
-        audio_manager = AudioManager(assets_root, current_character.audio_dir)
-        sys.modules['baldi_teacher.audio']._AUDIO_MANAGER = audio_manager
+    # Create the shared audio manager for the character's audio directory
+    get_audio_manager(current_character.audio_dir)
 
     client = GeminiChatClient(config, system_instruction=persona)
     bot = TeacherBot(config, client)
@@ -53,6 +51,8 @@ def run_gui(argv: Optional[Iterable[str]] = None) -> None:
         intro_question=args.intro,
         config=config,
         current_character=current_character,
+        # A --persona override is not the character's own persona, so not reusable
+        client=client if args.persona is None else None,
     )
     controller.run()
 
@@ -105,13 +105,13 @@ def _parse_args(argv: Optional[Iterable[str]]) -> argparse.Namespace:
     parser.add_argument(
         "--avatar-image",
         type=Path,
-        default=Path("assets/characters/baldi/character.webp"),
+        default=_ASSETS_DIR / "characters" / "baldi" / "character.webp",
         help="Path to Baldi's avatar image displayed in the window.",
     )
     parser.add_argument(
         "--thinking-image",
         type=Path,
-        default=Path("assets/characters/baldi/thinking.png"),
+        default=_ASSETS_DIR / "characters" / "baldi" / "thinking.png",
         help="Optional alternate image to show while Baldi is thinking.",
     )
     return parser.parse_args(list(argv) if argv is not None else None)
@@ -134,6 +134,7 @@ def _build_config(args: argparse.Namespace) -> AppConfig:
     return config
 
 
+@functools.lru_cache(maxsize=None)
 def _load_persona(persona_path: Optional[Path]) -> str:
     if persona_path is None:
         return BALDI_PERSONA_PROMPT
@@ -151,6 +152,7 @@ class BaldiTeacherController:
         intro_question: Optional[str],
         config: AppConfig,
         current_character: CharacterConfig,
+        client: Optional[GeminiChatClient] = None,
     ) -> None:
         self._bot = bot
         self._view = view
@@ -160,6 +162,13 @@ class BaldiTeacherController:
         self._audio = get_audio_manager()
         self._config = config
         self._current_character = current_character
+        # Gemini clients per character id, so switching back skips construction.
+        self._clients: dict[str, GeminiChatClient] = {}
+        if client is not None:  # The launch client, on the character's own persona
+            self._clients[current_character.id] = client
+        # One long-lived daemon worker owns the bot; requests queue up in order.
+        self._requests: queue.Queue[Optional[tuple[str, tuple[Path, ...]]]] = queue.Queue()
+        threading.Thread(target=self._run_worker, name="baldi-net", daemon=True).start()
 
     def run(self) -> None:
         """Start the GUI event loop and handle initial setup like intro question."""
@@ -169,14 +178,16 @@ class BaldiTeacherController:
         self._view.set_on_character_select(self._handle_character_select)
 
         # Initialize view with the current character's name
-        assets_root = Path(__file__).resolve().parents[2] / "assets"
-        avatar_path = assets_root / self._current_character.avatar_path
-        thinking_path = assets_root / self._current_character.thinking_path if self._current_character.thinking_path else None
+        avatar_path = _ASSETS_DIR / self._current_character.avatar_path
+        thinking_path = _ASSETS_DIR / self._current_character.thinking_path if self._current_character.thinking_path else None
         self._view.update_character(self._current_character.name, avatar_path, thinking_path)
 
         self._view.update_status(READY_STATUS)
         self._view.set_pending_state(False)
 
+        # Build the missing characters' clients in the background ahead of a switch.
+        threading.Thread(target=self._warm_clients, name="baldi-warmup", daemon=True).start()
+
         if self._intro_question:
             self._submit_intro(self._intro_question)
 
@@ -200,8 +211,13 @@ class BaldiTeacherController:
         if self._closing:
             return True
         self._closing = True
-        self._audio.play_event("window_close", blocking=True)
-        return True
+        self._requests.put(None)  # Stop the worker after any in-flight request.
+        # Let the goodbye cue play out with the window hidden instead of
+        # blocking the Tk loop; the view closes itself once it finishes.
+        finished = threading.Event()
+        self._audio.play_event("window_close", done=finished)
+        self._view.close_when_set(finished)
+        return False
 
     def _handle_character_select(self) -> None:
         """Open character selection dialog."""
@@ -224,27 +240,38 @@ class BaldiTeacherController:
 
         self._current_character = character
 
-        # Update audio manager with new character audio directory
-        assets_root = Path(__file__).resolve().parents[2] / "assets"
-        global _AUDIO_MANAGER
-        from .audio import _AUDIO_MANAGER
-        self._audio = AudioManager(assets_root, character.audio_dir)
-        # Update the global audio manager
-        import sys
-        sys.modules[__name__]._audio = self._audio
+        # Swap the shared manager's sounds; Gemini clients use the same manager
+        self._audio.character_audio_subdir = character.audio_dir
 
-        # Create new bot with updated character persona
-        client = GeminiChatClient(self._config, system_instruction=character.persona_prompt)
-        self._bot = TeacherBot(self._config, client)
+        # Fresh conversation with the new persona, on a reused client
+        self._bot = TeacherBot(self._config, self._get_client(character))
 
         # Update view with new character assets
-        avatar_path = assets_root / character.avatar_path
-        thinking_path = assets_root / character.thinking_path if character.thinking_path else None
+        avatar_path = _ASSETS_DIR / character.avatar_path
+        thinking_path = _ASSETS_DIR / character.thinking_path if character.thinking_path else None
         self._view.update_character(character.name, avatar_path, thinking_path)
 
         # Show system message about character change
         self._view.show_system_message(f"Switched to {character.name}! {character.description}")
 
+    def _get_client(self, character: CharacterConfig) -> GeminiChatClient:
+        client = self._clients.get(character.id)
+        if client is None:
+            client = self._clients.setdefault(
+                character.id,
+                GeminiChatClient(self._config, system_instruction=character.persona_prompt),
+            )
+        return client
+
+    def _warm_clients(self) -> None:
+        for character in CHARACTERS.values():
+            if character.id in self._clients:
+                continue
+            try:
+                self._get_client(character)
+            except Exception as exc:  # pragma: no cover - built again on switch
+                print(f"Warning: Could not prepare {character.name}: {exc}")
+
     # Conversation orchestration ------------------------------------------------
     def _submit_intro(self, question: str) -> None:
         self._view.show_user_message(question)
@@ -253,30 +280,44 @@ class BaldiTeacherController:
     def _start_async_request(self, text: str) -> None:
         self._set_pending(True)
         bookshelf_files = self._view.get_bookshelf_files()
-        threading.Thread(
-            target=self._generate_reply,
-            args=(text, bookshelf_files),
-            daemon=True,
-        ).start()
+        self._requests.put((text, bookshelf_files))
+
+    def _run_worker(self) -> None:
+        """Serve queued requests on the background thread until told to stop."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            self._generate_reply(*request)
 
     def _generate_reply(self, text: str, bookshelf_files: tuple[Path, ...]) -> None:
         """Request AI response in background thread and handle success or error."""
         try:
-            reply = self._bot.ask(text, bookshelf_files=bookshelf_files)
+            # Show the reply as it streams in rather than after the last token.
+            for chunk in self._bot.ask_stream(text, bookshelf_files=bookshelf_files):
+                if self._closing:
+                    return
+                self._view.run_on_ui_thread(functools.partial(self._handle_chunk, chunk))
         except Exception as exc:
             self._view.run_on_ui_thread(lambda exc=exc: self._handle_error(exc))
             return
-        self._view.run_on_ui_thread(lambda reply=reply: self._handle_reply(reply))
+        self._view.run_on_ui_thread(self._handle_reply)
+
+    def _handle_chunk(self, chunk: str) -> None:
+        if self._closing:
+            return
+        self._view.append_baldi_chunk(chunk)
 
-    def _handle_reply(self, reply: str) -> None:
+    def _handle_reply(self) -> None:
         if self._closing:
             return
-        self._view.show_baldi_message(reply)
+        self._view.finish_baldi_stream()
         self._set_pending(False)
 
     def _handle_error(self, exc: Exception) -> None:
         if self._closing:
             return
+        self._view.finish_baldi_stream()  # Keep whatever arrived before the error
         self._view.show_system_message(f"[Error] {exc}")
         self._set_pending(False, update_status=False)
         self._view.update_status(ERROR_STATUS)
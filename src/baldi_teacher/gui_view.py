@@ -1,26 +1,104 @@
 from __future__ import annotations
 
+import functools
+import os
+import queue
 import re
+import sys
+import threading
 import tkinter as tk
 from pathlib import Path
-from tkinter import filedialog, font as tkfont, messagebox
+from tkinter import filedialog, messagebox
 from tkinter import ttk
 from typing import Callable, Optional
 import html as html_module
 
 from PIL import Image, ImageDraw, ImageFilter, ImageTk
 from tkinterweb import HtmlFrame
-
+from tkinterweb.dom import HTMLElement
+
+
+AVATAR_SIZE = (220, 220)
+# Window backgrounds are rendered for sizes rounded up to this step, and the
+# most recent few are kept so resizing back and forth reuses them.
+_BACKGROUND_SIZE_STEP = 16
+_BACKGROUND_CACHE_SIZE = 4
+# How far the window's aspect ratio may move from the last full background
+# render before it is redrawn rather than rescaled.
+_BACKGROUND_MAX_ASPECT_DRIFT = 1.25
+# How far the window may outgrow the size the cached render was drawn for
+# before it is redrawn, so the blur never stretches with the window.
+_BACKGROUND_MAX_GROWTH = 1.5
+# Backgrounds are drawn and blurred at 1/N scale, then enlarged.
+_BACKGROUND_BLUR_SCALE = 4
+# Quiet period after the last resize event before the background is redrawn.
+_RESIZE_DEBOUNCE_MS = 50
+# Oldest messages are dropped from the conversation view beyond this many, so
+# long sessions keep layout and memory costs flat.
+MAX_RENDERED_MESSAGES = 200
 
 BOLD_PATTERN = re.compile(r"\*(.+?)\*")
+# Every line break str.splitlines() recognises.
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+# Anything that could make a reply more than one plain paragraph: markdown and
+# math markers, plus line breaks.
+_MARKUP_OR_BREAK = re.compile(f"[*$#\\\\{_LINE_BREAKS}]")
+# Most streamed reply text laid out per idle pass; a longer backlog continues on
+# the next pass so typing, scrolling and dragging stay responsive.
+_STREAM_RENDER_BATCH = 4096
+# Inline math: $$...$$, \(...\) or $...$, tried in that order at each position.
+_INLINE_MATH = re.compile(r"\$\$(.*?)\$\$|\\\((.*?)\\\)|\$(.*?)\$", re.DOTALL)
+# Block-level line syntax, matched against a stripped line: a "***" separator,
+# $$...$$ block math, a heading of one to three '#' and a space, or a bullet.
+_BLOCK_LINE = re.compile(
+    r"(?P<separator>\*\*\*\Z)"
+    r"|\$\$(?P<math>.+)\$\$\Z"
+    r"|(?P<heading>#{1,3}) (?P<heading_text>.*)"
+    r"|[-*] (?P<bullet>.*)"
+)
+# Rendering of a "***" line.
+_SEPARATOR_HTML = f'<div class="separator">{"-" * 48}</div>'
+
+
+def presized_avatar_path(image_path: Path) -> Path:
+    """Location of the avatar-sized WebP rendition of a character image."""
+    return image_path.with_name(f"{image_path.stem}_{AVATAR_SIZE[0]}.webp")
+
+
+def _bold_html(match: re.Match[str]) -> str:
+    return f"<strong>{match[1]}</strong>"
+
+
+def _format_bookshelf_display(path: Path) -> str:
+    """Listbox label for a bookshelf file, which was resolved when it was added."""
+    return f"{path.name} ({path.parent})"
+
+
+def _photo_cache_key(path: Optional[Path]) -> Optional[tuple[str, int, int]]:
+    """Cache key identifying the current contents of an image file, if readable."""
+    if not path:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _open_avatar_image(path: Path) -> Image.Image:
+    """Open ``path`` at avatar size, preferring a rendition generated offline."""
+    presized = presized_avatar_path(path)
+    if presized.exists():
+        # Shipped at display size by scripts/generate_thumbnails.py
+        return Image.open(presized)
+    image = Image.open(path)
+    image.thumbnail(AVATAR_SIZE)
+    return image
 
 
 class BaldiGUITheme:
     """Encapsulates fonts and style configuration for the Baldi GUI."""
 
-    def __init__(self) -> None:
-        self._fonts: dict[str, tkfont.Font] = {}
-
     def apply(self, root: tk.Misc) -> ttk.Style:
         """Configure ttk theme with glass-style colors and modern typography."""
         style = ttk.Style(root)
@@ -215,6 +293,8 @@ class BaldiTeacherView:
         self._root.configure(bg="#0f172a")
 
         self._style = self._theme.apply(self._root)
+        # Theme markup shared by every page load, built once per view.
+        self._html_head = self._theme.get_mathjax_config() + self._theme.get_css()
 
         self._status_var = tk.StringVar(value="Ready to learn!")
         self._is_pending = False
@@ -225,24 +305,64 @@ class BaldiTeacherView:
         self._avatar_path = avatar_path
         self._thinking_path = thinking_path
         self._character_name = "Baldi"  # Default character name
+        self._character_args: Optional[tuple[str, Path, Optional[Path]]] = None
         self._avatar_fallback_text = "Baldi\nis\nwatching!"
         self._title_text_ready = "Baldi is ready to help!\nAsk anything, but write neatly!"
         self._title_text_thinking = "Baldi is thinking...\nGive him a moment to respond!"
         self._title_label: Optional[ttk.Label] = None
+        self._title_shown = ""
 
         self._conversation: HtmlFrame
-        self._conversation_html: list[str] = []
+        self._rendered_messages = 0
+        self._scroll_pending = False
+        # Reply currently streaming in: its element id and the text so far. Finished
+        # lines are laid out once into blocks ahead of a tail that holds the line
+        # still being written; _stream_rendered counts the characters already blocked.
+        self._stream_id: Optional[str] = None
+        self._stream_chunks: list[str] = []
+        self._stream_count = 0
+        self._stream_render_pending = False
+        self._stream_element: Optional[HTMLElement] = None
+        self._stream_tail: Optional[HTMLElement] = None
+        self._stream_tail_text = ""
+        self._stream_rendered = 0
+        self._stream_closing = False
         self._input_box: tk.Text
         self._send_button: ttk.Button
         self._avatar_label: ttk.Label
         self._avatar_image_default: Optional[ImageTk.PhotoImage] = None
         self._avatar_image_thinking: Optional[ImageTk.PhotoImage] = None
+        # What the avatar label last showed: a PhotoImage or the fallback text.
+        self._avatar_shown: object = None
+        self._photo_cache: dict[tuple[str, int, int], ImageTk.PhotoImage] = {}
         self._background_label: tk.Label
         self._background_photo: Optional[ImageTk.PhotoImage] = None
+        self._background_cache: dict[tuple[int, int], ImageTk.PhotoImage] = {}
+        self._glass_master: Optional[Image.Image] = None
         self._last_bg_size: tuple[int, int] = (0, 0)
+        self._resize_after_id: Optional[str] = None
         self._bookshelf_files: list[Path] = []
+        self._bookshelf_set: set[Path] = set()  # Same paths, for membership tests
         self._bookshelf_listbox: Optional[tk.Listbox] = None
+        self._bookshelf_shown: list[str] = []  # Labels currently in the listbox
         self._on_bookshelf_change: Optional[Callable[[tuple[Path, ...]], None]] = None
+        self._bookshelf_change_pending = False
+
+        # Worker threads hand callbacks to Tk through a queue plus a wake-up pipe
+        # where Tcl supports file handlers (not on Windows; see run_on_ui_thread).
+        self._ui_calls: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        self._wakeup_fds: Optional[tuple[int, int]] = None
+        # Set by stop(); workers that finish later drop their callbacks instead of
+        # writing to closed descriptors or a destroyed root.
+        self._closed = False
+        self._closed_lock = threading.Lock()
+        if hasattr(self._root.tk, "createfilehandler"):
+            self._wakeup_fds = os.pipe()
+            # A full pipe already has a wake-up pending, so never block on it.
+            os.set_blocking(self._wakeup_fds[1], False)
+            self._root.tk.createfilehandler(
+                self._wakeup_fds[0], tk.READABLE, self._drain_ui_calls
+            )
 
         self._build_ui()
         self._root.protocol("WM_DELETE_WINDOW", self._handle_close_event)
@@ -269,11 +389,45 @@ class BaldiTeacherView:
         self._root.mainloop()
 
     def stop(self) -> None:
+        with self._closed_lock:
+            self._closed = True
+            if self._wakeup_fds is not None:
+                self._root.tk.deletefilehandler(self._wakeup_fds[0])
+                for fd in self._wakeup_fds:
+                    os.close(fd)
+                self._wakeup_fds = None
         self._root.quit()
         self._root.destroy()
 
+    def close_when_set(self, finished: threading.Event) -> None:
+        """Hide the window now and destroy it once ``finished`` is set."""
+        self._root.withdraw()
+
+        def poll() -> None:
+            if finished.is_set():
+                self.stop()
+            else:
+                self._root.after(20, poll)
+
+        poll()
+
     def run_on_ui_thread(self, func: Callable[[], None]) -> None:
-        self._root.after(0, func)
+        with self._closed_lock:
+            if self._closed:
+                return
+            if self._wakeup_fds is not None:
+                self._ui_calls.put(func)
+                try:
+                    os.write(self._wakeup_fds[1], b"\0")
+                except OSError:
+                    pass  # Pipe full: the UI thread has wake-ups to drain already
+                return
+        # Without a wake-up pipe, Tk marshals after() to the UI thread; called
+        # outside the lock so stop() on that thread never waits on it.
+        try:
+            self._root.after(0, func)
+        except (tk.TclError, RuntimeError):
+            pass  # The window was destroyed meanwhile
 
     def update_status(self, text: str) -> None:
         self._status_var.set(text)
@@ -292,24 +446,47 @@ class BaldiTeacherView:
     def show_baldi_message(self, text: str) -> None:
         self._append_message(self._character_name, text, "baldi")
 
+    def append_baldi_chunk(self, chunk: str) -> None:
+        """Add streamed reply text to the message being received, starting one if needed."""
+        while self._stream_closing:
+            self._render_stream()  # Lay out the rest of the previous reply first
+        if self._stream_id is None:
+            self._stream_count += 1
+            self._stream_id = f"stream-{self._stream_count}"
+            self._add_message_html(
+                self._format_message_html(
+                    self._character_name, "", "baldi", text_id=self._stream_id
+                )
+            )
+            document = self._conversation.document
+            self._stream_element = document.getElementById(self._stream_id)
+            self._stream_tail = document.createElement("div")
+            self._stream_element.appendChild(self._stream_tail)
+        self._stream_chunks.append(chunk)
+        self._schedule_stream_render()
+
+    def finish_baldi_stream(self) -> None:
+        """Lay out the rest of the streamed reply and close it."""
+        if self._stream_id is None:
+            return
+        self._stream_closing = True
+        self._schedule_stream_render()
+
     def show_system_message(self, text: str) -> None:
         self._append_message("System", text, "system")
 
     def update_character(self, character_name: str, avatar_path: Path, thinking_path: Optional[Path]) -> None:
         """Reload avatar images and update all UI elements to reflect new character."""
+        character_args = (character_name, avatar_path, thinking_path)
+        if character_args == self._character_args:
+            return  # Already showing this character; skip the image reload
+        self._character_args = character_args
         self._character_name = character_name  # Store the character name
         self._avatar_path = avatar_path
         self._thinking_path = thinking_path
 
-        # Reload avatar images
-        self._avatar_image_default = self._create_photo_image(self._avatar_path)
-        if self._thinking_path is not None:
-            self._avatar_image_thinking = self._create_photo_image(self._thinking_path)
-        else:
-            self._avatar_image_thinking = None
-
-        # Update the displayed avatar
-        self._update_avatar_state()
+        # Reload avatar images; decoding happens off the UI thread
+        self._request_avatar_images()
 
         # Update window title
         self._root.title(f"{character_name}'s Notebook of Knowledge")
@@ -317,10 +494,23 @@ class BaldiTeacherView:
         # Update title text
         self._title_text_ready = f"{character_name} is ready to help!\nAsk anything, but write neatly!"
         self._title_text_thinking = f"{character_name} is thinking...\nGive them a moment to respond!"
-        if self._title_label:
-            self._title_label.configure(text=self._title_text_ready if not self._is_pending else self._title_text_thinking)
+        self._set_title_text(self._title_text_ready if not self._is_pending else self._title_text_thinking)
 
     # Internal helpers -----------------------------------------------------------
+    def _drain_ui_calls(self, fd: int, mask: int) -> None:
+        os.read(fd, 512)
+        while not self._closed:
+            try:
+                func = self._ui_calls.get_nowait()
+            except queue.Empty:
+                return
+            # Report like after() callbacks do: Tk re-raises file handler errors
+            # from mainloop(), and the rest of the queue must still run.
+            try:
+                func()
+            except Exception:
+                self._root.report_callback_exception(*sys.exc_info())
+
     def _build_ui(self) -> None:
         self._background_label = tk.Label(self._root, bd=0)
         self._background_label.place(x=0, y=0, relwidth=1, relheight=1)
@@ -351,6 +541,7 @@ class BaldiTeacherView:
         )
         title_label.pack(side="left", anchor="n")
         self._title_label = title_label
+        self._title_shown = self._title_text_ready
 
         # Button container for right-side buttons
         button_container = ttk.Frame(header, style="GlassMain.TFrame")
@@ -544,8 +735,7 @@ class BaldiTeacherView:
         <html>
         <head>
             <meta charset="utf-8">
-            {self._theme.get_mathjax_config()}
-            {self._theme.get_css()}
+            {self._html_head}
         </head>
         <body>
             <div id="messages">
@@ -554,7 +744,7 @@ class BaldiTeacherView:
         </html>
         """
         self._conversation.load_html(base_html)
-        self._conversation_html = []
+        self._rendered_messages = 0
 
     def _handle_add_bookshelf_files(self) -> None:
         if self._bookshelf_listbox is None:
@@ -586,8 +776,9 @@ class BaldiTeacherView:
             if suffix not in {".pdf", ".txt"}:
                 unsupported.append(f"{resolved.name} (unsupported type)")
                 continue
-            if resolved in self._bookshelf_files:
+            if resolved in self._bookshelf_set:
                 continue
+            self._bookshelf_set.add(resolved)
             self._bookshelf_files.append(resolved)
             added = True
 
@@ -611,7 +802,7 @@ class BaldiTeacherView:
             return
         for index in sorted(selection, reverse=True):
             if 0 <= index < len(self._bookshelf_files):
-                del self._bookshelf_files[index]
+                self._bookshelf_set.discard(self._bookshelf_files.pop(index))
         self._refresh_bookshelf_list()
         self._notify_bookshelf_change()
 
@@ -619,27 +810,42 @@ class BaldiTeacherView:
         if not self._bookshelf_files:
             return
         self._bookshelf_files.clear()
+        self._bookshelf_set.clear()
         self._refresh_bookshelf_list()
         self._notify_bookshelf_change()
 
     def _refresh_bookshelf_list(self) -> None:
         if self._bookshelf_listbox is None:
             return
-        self._bookshelf_listbox.delete(0, "end")
-        for path in self._bookshelf_files:
-            self._bookshelf_listbox.insert("end", self._format_bookshelf_display(path))
+        shown = self._bookshelf_shown
+        labels = [_format_bookshelf_display(path) for path in self._bookshelf_files]
+        # Only touch the rows between the unchanged head and tail, e.g. just the
+        # new rows after an add or the removed one after a delete.
+        limit = min(len(shown), len(labels))
+        head = 0
+        while head < limit and shown[head] == labels[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and shown[-1 - tail] == labels[-1 - tail]:
+            tail += 1
+        if head + tail < len(shown):
+            self._bookshelf_listbox.delete(head, len(shown) - tail - 1)
+        if head + tail < len(labels):
+            # One Tcl call for all new rows rather than one per file.
+            self._bookshelf_listbox.insert(head, *labels[head:len(labels) - tail])
+        self._bookshelf_shown = labels
 
     def _notify_bookshelf_change(self) -> None:
-        if self._on_bookshelf_change is None:
+        if self._on_bookshelf_change is None or self._bookshelf_change_pending:
             return
-        self._on_bookshelf_change(tuple(self._bookshelf_files))
+        # Report once per idle pass, so a burst of <Delete> presses is one change.
+        self._bookshelf_change_pending = True
+        self._root.after_idle(self._emit_bookshelf_change)
 
-    def _format_bookshelf_display(self, path: Path) -> str:
-        try:
-            display_path = path.resolve()
-        except OSError:
-            display_path = path
-        return f"{display_path.name} ({display_path.parent})"
+    def _emit_bookshelf_change(self) -> None:
+        self._bookshelf_change_pending = False
+        if self._on_bookshelf_change is not None:
+            self._on_bookshelf_change(tuple(self._bookshelf_files))
 
     def _on_bookshelf_delete_key(self, event: tk.Event) -> str:
         self._remove_selected_bookshelf_files()
@@ -655,13 +861,13 @@ class BaldiTeacherView:
         self._input_box.focus_set()
 
     def _on_return_pressed(self, event: tk.Event) -> str:
-        if event.state & 0x0001:  # Shift held
-            return "break"
+        # Shift+Return has its own, more specific binding, so Tk never routes it here.
         self._handle_send_event()
         return "break"
 
-    def _on_shift_return_pressed(self, event: tk.Event) -> None:
+    def _on_shift_return_pressed(self, event: tk.Event) -> str:
         self._input_box.insert("insert", "\n")
+        return "break"  # Skip the Text class binding, which would add a second newline
 
     def _handle_close_event(self) -> None:
         if self._on_close:
@@ -681,10 +887,7 @@ class BaldiTeacherView:
         self._avatar_label.pack()
         self._avatar_label.bind("<Button-1>", self._handle_avatar_click)
 
-        self._avatar_image_default = self._create_photo_image(self._avatar_path)
-        if self._thinking_path is not None:
-            self._avatar_image_thinking = self._create_photo_image(self._thinking_path)
-        self._update_avatar_state()
+        self._request_avatar_images()
 
     def _handle_avatar_click(self, event=None) -> None:
         """Handle avatar click to open character selector."""
@@ -699,23 +902,114 @@ class BaldiTeacherView:
     def _append_message(self, speaker: str, text: str, message_type: str) -> None:
         """Append a message to the conversation as HTML."""
         html_content = self._format_message_html(speaker, text, message_type)
-        self._conversation_html.append(html_content)
-        self._update_conversation_display()
-
-    def _format_message_html(self, speaker: str, text: str, message_type: str) -> str:
+        # Parse only the new message into the live document; reloading the whole
+        # page re-parses and re-lays out every earlier message too.
+        self._add_message_html(html_content)
+        self._schedule_scroll_to_end()
+
+    def _add_message_html(self, html_content: str) -> None:
+        """Append one message to the live document, dropping the oldest past the cap."""
+        self._conversation.add_html(html_content)
+        self._rendered_messages += 1
+        if self._rendered_messages > MAX_RENDERED_MESSAGES:
+            self._conversation.document.querySelector("div.message").remove()
+            self._rendered_messages -= 1
+
+    def _schedule_stream_render(self) -> None:
+        if not self._stream_render_pending:
+            # Render at most once per idle pass, however many chunks arrive.
+            self._stream_render_pending = True
+            self._root.after_idle(self._render_stream)
+
+    def _render_stream(self) -> None:
+        self._stream_render_pending = False
+        if self._stream_id is None:
+            return
+        text = "".join(self._stream_chunks)
+        start = self._stream_rendered
+        if start == 0:
+            start = len(text) - len(text.lstrip())  # The reply is shown stripped
+        # Find the finished lines to block up this pass. Blank lines wait for a
+        # following line so that trailing ones never render, as with strip().
+        end = position = start
+        backlog = False
+        for line in text[start:].splitlines(keepends=True):
+            if position - start >= _STREAM_RENDER_BATCH:
+                backlog = True
+                break
+            if not self._stream_closing and (
+                line[-1] not in _LINE_BREAKS
+                or (line[-1] == "\r" and position + len(line) == len(text))
+            ):
+                break  # Still being written (a lone "\r" may become "\r\n")
+            position += len(line)
+            if line.strip():
+                end = position
+        if backlog and end == start:
+            if text[position:].strip():
+                end = position  # A long run of blank lines with more text after it
+            else:
+                backlog = False  # Nothing but whitespace left for now
+
+        if end > start:
+            block = self._conversation.document.createElement("div")
+            self._stream_element.insertBefore(block, self._stream_tail)
+            block.innerHTML = self._text_to_html(text[start:end], "baldi")
+            self._stream_rendered = end
+        # Each innerHTML assignment is a Tcl round trip plus a full widget update,
+        # so the tail is only rewritten when its text has changed.
+        tail_text = "" if backlog else text[end:].rstrip()
+        if tail_text != self._stream_tail_text:
+            self._stream_tail.innerHTML = self._text_to_html(tail_text, "baldi")
+            self._stream_tail_text = tail_text
+        if backlog:
+            self._schedule_stream_render()
+        elif self._stream_closing:
+            self._stream_id = None
+            self._stream_chunks = []
+            self._stream_element = None
+            self._stream_tail = None
+            self._stream_tail_text = ""
+            self._stream_rendered = 0
+            self._stream_closing = False
+        self._schedule_scroll_to_end()
+
+    def _schedule_scroll_to_end(self) -> None:
+        if not self._scroll_pending:
+            # One scroll per idle pass, after Tk has laid out everything appended.
+            self._scroll_pending = True
+            self._conversation.after_idle(self._scroll_conversation_to_end)
+
+    def _scroll_conversation_to_end(self) -> None:
+        self._scroll_pending = False
+        self._conversation.yview_moveto(1.0)
+
+    def _format_message_html(
+        self, speaker: str, text: str, message_type: str, text_id: str = ""
+    ) -> str:
         """Format a message as HTML with MathJax support."""
         escaped_speaker = html_module.escape(speaker)
         formatted_text = self._text_to_html(text, message_type)
+        id_attr = f' id="{text_id}"' if text_id else ""
 
         return f"""
         <div class="message">
             <span class="label-{message_type}">{escaped_speaker}&gt;</span>
-            <span class="text-{message_type}">{formatted_text}</span>
+            <span class="text-{message_type}"{id_attr}>{formatted_text}</span>
         </div>
         """
 
     def _text_to_html(self, text: str, message_type: str) -> str:
         """Parse markdown-style text into HTML, handling headings, bullets, and math expressions."""
+        stripped_text = text.strip()
+        if (
+            stripped_text
+            and not stripped_text.startswith("- ")
+            and _MARKUP_OR_BREAK.search(text) is None
+        ):
+            # One line of plain prose, the usual short answer.
+            return f"<p>{html_module.escape(text)}</p>"
+
         lines = text.splitlines()
         if not lines:
             return ""
@@ -728,48 +1022,35 @@ class BaldiTeacherView:
                 html_parts.append("<br>")
                 continue
 
-            if stripped == "***":
-                html_parts.append('<div class="separator">------------------------------------------------</div>')
-                continue
+            # Most lines are prose; only these first characters can start block syntax.
+            match = _BLOCK_LINE.match(stripped) if stripped[0] in "*$#-" else None
+            kind = match.lastgroup if match else None
 
-            # Block math $$...$$
-            if stripped.startswith("$$") and stripped.endswith("$$") and len(stripped) > 4:
-                math_content = stripped[2:-2].strip()
+            if kind == "separator":
+                html_parts.append(_SEPARATOR_HTML)
+            elif kind == "math":
+                math_content = match["math"].strip()
                 html_parts.append(f'<div class="math-block">$$\\displaystyle {math_content}$$</div>')
-                continue
-
-            # Headings
-            if stripped.startswith("### "):
-                content = stripped[4:].strip()
-                content_html = self._process_inline_formatting(content)
-                html_parts.append(f"<h3>{content_html}</h3>")
-                continue
-            elif stripped.startswith("## "):
-                content = stripped[3:].strip()
-                content_html = self._process_inline_formatting(content)
-                html_parts.append(f"<h2>{content_html}</h2>")
-                continue
-            elif stripped.startswith("# "):
-                content = stripped[2:].strip()
-                content_html = self._process_inline_formatting(content)
-                html_parts.append(f"<h1>{content_html}</h1>")
-                continue
-
-            # Bullet points
-            if stripped.startswith(("- ", "* ")):
-                content = stripped[2:].strip()
-                content_html = self._process_inline_formatting(content)
+            elif kind == "heading_text":
+                level = len(match["heading"])
+                content_html = self._process_inline_formatting(match["heading_text"].strip())
+                html_parts.append(f"<h{level}>{content_html}</h{level}>")
+            elif kind == "bullet":
+                content_html = self._process_inline_formatting(match["bullet"].strip())
                 html_parts.append(f"<ul><li>{content_html}</li></ul>")
-                continue
-
-            # Regular paragraph
-            content_html = self._process_inline_formatting(line)
-            html_parts.append(f"<p>{content_html}</p>")
+            else:
+                # Regular paragraph
+                content_html = self._process_inline_formatting(line)
+                html_parts.append(f"<p>{content_html}</p>")
 
         return "\n".join(html_parts)
 
     def _process_inline_formatting(self, text: str) -> str:
         """Convert inline formatting to HTML, wrapping math expressions in MathJax delimiters."""
+        if "*" not in text and "$" not in text and "\\(" not in text:
+            # Plain prose: nothing to split or embolden, just escape it.
+            return html_module.escape(text)
+
         result_parts = []
 
         # Split by math segments first
@@ -782,139 +1063,112 @@ class BaldiTeacherView:
             if is_math:
                 # Inline math - wrap with MathJax delimiters
                 result_parts.append(f'<span class="math-inline">\\({segment}\\)</span>')
+            elif "*" not in segment:
+                result_parts.append(html_module.escape(segment))
             else:
-                # Process bold formatting in non-math segments
-                cursor = 0
-                for match in BOLD_PATTERN.finditer(segment):
-                    # Add text before the match
-                    if cursor < match.start():
-                        result_parts.append(html_module.escape(segment[cursor:match.start()]))
-                    # Add bold text
-                    bold_text = html_module.escape(match.group(1))
-                    result_parts.append(f"<strong>{bold_text}</strong>")
-                    cursor = match.end()
-                # Add remaining text
-                if cursor < len(segment):
-                    result_parts.append(html_module.escape(segment[cursor:]))
+                # Escaping never touches '*', so bold runs can be marked up in the
+                # escaped text with one substitution.
+                result_parts.append(
+                    BOLD_PATTERN.sub(_bold_html, html_module.escape(segment))
+                )
 
         return "".join(result_parts)
 
     def _split_math_segments(self, text: str) -> list[tuple[bool, str]]:
         """Parse text to identify math expressions delimited by $...$ or \\(...\\) for separate processing."""
+        if "$" not in text and "\\(" not in text:
+            return [(False, text)] if text else []  # No math, e.g. a bold-only line
         segments: list[tuple[bool, str]] = []
-        buffer: list[str] = []
-        i = 0
-        length = len(text)
-
-        while i < length:
-            # Check for $$...$$
-            if text.startswith("$$", i):
-                end = text.find("$$", i + 2)
-                if end != -1:
-                    if buffer:
-                        segments.append((False, "".join(buffer)))
-                        buffer.clear()
-                    segments.append((True, text[i + 2:end]))
-                    i = end + 2
-                    continue
-
-            # --- THIS IS THE FIX ---
-            # Added check for \( ... \) delimiters
-            # Check for \(...\)
-            if text.startswith("\\(", i):
-                end = text.find("\\)", i + 2)
-                if end != -1:
-                    if buffer:
-                        segments.append((False, "".join(buffer)))
-                        buffer.clear()
-                    segments.append((True, text[i + 2:end]))
-                    i = end + 2
-                    continue
-            # --- END OF FIX ---
-            
-            # Check for $...$
-            if text[i] == "$":
-                end = text.find("$", i + 1)
-                if end != -1:
-                    if buffer:
-                        segments.append((False, "".join(buffer)))
-                        buffer.clear()
-                    segments.append((True, text[i + 1:end]))
-                    i = end + 1
-                    continue
-
-            buffer.append(text[i])
-            i += 1
-
-        if buffer:
-            segments.append((False, "".join(buffer)))
-
+        cursor = 0
+        for match in _INLINE_MATH.finditer(text):
+            if cursor < match.start():
+                segments.append((False, text[cursor:match.start()]))
+            segments.append((True, match[match.lastindex]))
+            cursor = match.end()
+        if cursor < len(text):
+            segments.append((False, text[cursor:]))
         return segments
 
-    def _update_conversation_display(self) -> None:
-        """Update the HTML display with all messages and trigger MathJax rendering."""
-        messages_html = "\n".join(self._conversation_html)
-
-        full_html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            {self._theme.get_mathjax_config()}
-            {self._theme.get_css()}
-        </head>
-        <body>
-            <div id="messages">
-                {messages_html}
-            </div>
-            <script>
-                // Scroll to bottom after rendering
-                window.onload = function() {{
-                    window.scrollTo(0, document.body.scrollHeight);
-
-                    // Re-render MathJax if available
-                    if (typeof MathJax !== 'undefined' && MathJax.typesetPromise) {{
-                        MathJax.typesetPromise();
-                    }}
-                }};
-            </script>
-        </body>
-        </html>
-        """
-
-        self._conversation.load_html(full_html)
-
     def _handle_window_resize(self, event: tk.Event) -> None:
-        if event.widget is self._root:
-            self._update_background_image(event.width, event.height)
+        if event.widget is not self._root:
+            return
+        # A drag fires Configure for every step; only redraw once it settles.
+        if self._resize_after_id is not None:
+            self._root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self._root.after(
+            _RESIZE_DEBOUNCE_MS, self._finish_window_resize, event.width, event.height
+        )
+
+    def _finish_window_resize(self, width: int, height: int) -> None:
+        self._resize_after_id = None
+        self._update_background_image(width, height)
 
     def _update_background_image(self, width: int, height: int) -> None:
         if width <= 0 or height <= 0:
             return
-        size = (width, height)
+        # Round up so the image still covers the window; the label centres it.
+        step = _BACKGROUND_SIZE_STEP
+        size = (-(-width // step) * step, -(-height // step) * step)
         if size == self._last_bg_size:
             return
         self._last_bg_size = size
-        image = self._create_glass_background(width, height)
-        self._background_photo = ImageTk.PhotoImage(image)
-        self._background_label.configure(image=self._background_photo)
+        photo = self._background_cache.pop(size, None)
+        if photo is None:
+            photo = ImageTk.PhotoImage(self._glass_background(size))
+            if len(self._background_cache) >= _BACKGROUND_CACHE_SIZE:
+                del self._background_cache[next(iter(self._background_cache))]
+        self._background_cache[size] = photo  # Most recently used last
+        self._background_photo = photo
+        self._background_label.configure(image=photo)
+
+    def _glass_background(self, size: tuple[int, int]) -> Image.Image:
+        """Background at ``size``, rescaled from the cached small render when it still fits."""
+        master = self._glass_master
+        if master is not None:
+            # The artwork is all proportional and blurred, so one small render
+            # serves smaller windows and modest growth until the shape changes a lot.
+            drift = (size[0] * master.height) / (size[1] * master.width)
+            if not 1 / _BACKGROUND_MAX_ASPECT_DRIFT <= drift <= _BACKGROUND_MAX_ASPECT_DRIFT:
+                master = None
+            elif size[0] > master.width * _BACKGROUND_BLUR_SCALE * _BACKGROUND_MAX_GROWTH:
+                master = None
+            elif size[1] > master.height * _BACKGROUND_BLUR_SCALE * _BACKGROUND_MAX_GROWTH:
+                master = None
+        if master is None:
+            scale = _BACKGROUND_BLUR_SCALE
+            master = self._create_glass_background(
+                max(size[0] // scale, 1), max(size[1] // scale, 1)
+            )
+            self._glass_master = master
+        # The only full-size buffer, already RGB for display.
+        return master.resize(size, Image.BILINEAR)
 
     def _create_glass_background(self, width: int, height: int) -> Image.Image:
-        """Generate gradient background with blurred overlay shapes for glassmorphic effect."""
+        """Generate gradient background with blurred overlay shapes for glassmorphic effect.
+
+        Rendered at 1/_BACKGROUND_BLUR_SCALE of the window size: the blur leaves no
+        fine detail, so it is drawn and blurred small and enlarged for display.
+        """
+        layers = self._draw_glass_layers(width, height)
+        blurred = layers.filter(ImageFilter.GaussianBlur(radius=18 / _BACKGROUND_BLUR_SCALE))
+        return blurred.convert("RGB")  # Opaque; drop alpha while the image is small
+
+    def _draw_glass_layers(self, width: int, height: int) -> Image.Image:
+        """Gradient with the translucent overlay shapes, before blurring."""
         height = max(height, 1)
-        gradient = Image.new("RGB", (1, height))
-        draw = ImageDraw.Draw(gradient)
         top_color = (15, 23, 42)
         bottom_color = (30, 64, 175)
-        for y in range(height):
-            factor = y / max(height - 1, 1)
-            color = tuple(
-                int(top + (bottom - top) * factor)
-                for top, bottom in zip(top_color, bottom_color)
-            )
-            draw.point((0, y), fill=color)
-        gradient = gradient.resize((width, height), Image.BILINEAR)
-        gradient = gradient.convert("RGBA")
+        # Stretch PIL's built-in 0-255 ramp to the window height and map it onto
+        # each channel with a lookup table, instead of drawing row by row.
+        ramp = Image.linear_gradient("L").resize((1, height), Image.BILINEAR)
+        bands = [
+            ramp.point([int(top + (bottom - top) * value / 255) for value in range(256)])
+            for top, bottom in zip(top_color, bottom_color)
+        ]
+        # Build the column with its opaque alpha band, then copy it across:
+        # NEAREST keeps the rows as they are, so no resampling or convert pass.
+        column = Image.merge("RGBA", [*bands, Image.new("L", (1, height), 255)])
+        gradient = column.resize((width, height), Image.NEAREST)
 
         overlay = Image.new("RGBA", (width, height), (255, 255, 255, 0))
         overlay_draw = ImageDraw.Draw(overlay)
@@ -946,54 +1200,101 @@ class BaldiTeacherView:
             fill=(110, 231, 183, 55),
         )
 
-        combined = Image.alpha_composite(gradient, overlay)
-        return combined.filter(ImageFilter.GaussianBlur(radius=18))
+        return Image.alpha_composite(gradient, overlay)
 
     def _update_avatar_state(self) -> None:
         thinking_active = self._is_pending and self._avatar_image_thinking is not None
-        if thinking_active:
-            self._avatar_label.configure(
-                image=self._avatar_image_thinking,
-                text="",
-                style="GlassAvatar.TLabel",
-                padding=0,
-            )
-        elif self._avatar_image_default is not None:
-            self._avatar_label.configure(
-                image=self._avatar_image_default,
-                text="",
-                style="GlassAvatar.TLabel",
-                padding=0,
-            )
-        elif self._avatar_image_thinking is not None:
-            self._avatar_label.configure(
-                image=self._avatar_image_thinking,
-                text="",
-                style="GlassAvatar.TLabel",
-                padding=0,
-            )
+        if thinking_active or self._avatar_image_default is None:
+            image = self._avatar_image_thinking
         else:
-            self._avatar_label.configure(
-                image="",
-                text=self._avatar_fallback_text,
-                style="GlassAvatar.TLabel",
-                padding=12,
-            )
-        if self._title_label is not None:
-            if thinking_active:
-                self._title_label.configure(text=self._title_text_thinking)
+            image = self._avatar_image_default
+        # Each configure is a Tcl round trip; only issue it when the label changes.
+        shown = image if image is not None else self._avatar_fallback_text
+        if shown is not self._avatar_shown:
+            self._avatar_shown = shown
+            if image is not None:
+                self._avatar_label.configure(
+                    image=image,
+                    text="",
+                    style="GlassAvatar.TLabel",
+                    padding=0,
+                )
             else:
-                self._title_label.configure(text=self._title_text_ready)
-
-    def _create_photo_image(self, path: Optional[Path]) -> Optional[ImageTk.PhotoImage]:
-        if not path:
-            return None
-        try:
-            image = Image.open(path)
-            image.thumbnail((220, 220))
-            return ImageTk.PhotoImage(image)
-        except Exception:
-            return None
+                self._avatar_label.configure(
+                    image="",
+                    text=self._avatar_fallback_text,
+                    style="GlassAvatar.TLabel",
+                    padding=12,
+                )
+        if thinking_active:
+            self._set_title_text(self._title_text_thinking)
+        else:
+            self._set_title_text(self._title_text_ready)
+
+    def _set_title_text(self, text: str) -> None:
+        if self._title_label is not None and text != self._title_shown:
+            self._title_shown = text
+            self._title_label.configure(text=text)
+
+    def _request_avatar_images(self) -> None:
+        """Show the current character's avatars, decoding any not yet cached in the background."""
+        paths = (self._avatar_path, self._thinking_path)
+        keys = tuple(_photo_cache_key(path) for path in paths)
+        if all(key is None or key in self._photo_cache for key in keys):
+            # Switching back to a character reuses its images instead of re-decoding.
+            self._show_avatar_images(paths, keys, (None, None))
+            return
+        # Show the text placeholder until the worker hands the images back.
+        self._avatar_image_default = None
+        self._avatar_image_thinking = None
+        self._update_avatar_state()
+        threading.Thread(
+            target=self._decode_avatar_images,
+            args=(paths, keys),
+            name="baldi-avatar",
+            daemon=True,
+        ).start()
+
+    def _decode_avatar_images(
+        self,
+        paths: tuple[Optional[Path], Optional[Path]],
+        keys: tuple[Optional[tuple[str, int, int]], ...],
+    ) -> None:
+        images: list[Optional[Image.Image]] = []
+        for path, key in zip(paths, keys):
+            image = None
+            if path is not None and key is not None:
+                try:
+                    image = _open_avatar_image(path)
+                    image.load()
+                except Exception:
+                    image = None
+            images.append(image)
+        # PhotoImage objects belong to Tk, so they are only built back on the UI thread.
+        self.run_on_ui_thread(
+            functools.partial(self._show_avatar_images, paths, keys, tuple(images))
+        )
 
+    def _show_avatar_images(
+        self,
+        paths: tuple[Optional[Path], Optional[Path]],
+        keys: tuple[Optional[tuple[str, int, int]], ...],
+        images: tuple[Optional[Image.Image], ...],
+    ) -> None:
+        if paths != (self._avatar_path, self._thinking_path):
+            return  # The character changed again while these were decoding
+        photos: list[Optional[ImageTk.PhotoImage]] = []
+        for key, image in zip(keys, images):
+            photo = self._photo_cache.get(key) if key is not None else None
+            if photo is None and image is not None:
+                try:
+                    photo = ImageTk.PhotoImage(image)
+                except Exception:
+                    photo = None
+                else:
+                    self._photo_cache[key] = photo
+            photos.append(photo)
+        self._avatar_image_default, self._avatar_image_thinking = photos
+        self._update_avatar_state()
 
 __all__ = ["BaldiGUITheme", "BaldiTeacherView"]
\ No newline at end of file
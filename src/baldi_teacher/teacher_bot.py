@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from collections import deque
 from pathlib import Path
-from typing import Deque, Sequence
+from typing import Deque, Iterator, Sequence
 
 from .config import AppConfig
 from .gemini_client import GeminiChatClient
@@ -42,6 +42,23 @@ class TeacherBot:
         self._append_model(reply)
         return reply
 
+    def ask_stream(
+        self,
+        message: str,
+        *,
+        bookshelf_files: Sequence[Path] | None = None,
+    ) -> Iterator[str]:
+        """Like ``ask`` but yield the reply in fragments as it arrives."""
+        self._append_user(message)
+        fragments: list[str] = []
+        for fragment in self._client.stream_reply(
+            tuple(self._history),
+            attachments=tuple(bookshelf_files) if bookshelf_files else (),
+        ):
+            fragments.append(fragment)
+            yield fragment
+        self._append_model("".join(fragments))
+
     def _append_user(self, text: str) -> None:
         self._history.append(ChatMessage(role="user", text=text.strip()))
 
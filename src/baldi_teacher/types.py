@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal, Sequence
 
 
 Role = Literal["user", "model"]
@@ -13,11 +13,18 @@ class ChatMessage:
 
     role: Role
     text: str
+    # Serialised once; the history replays every message on each turn.
+    _gemini_content: Any = field(default=None, init=False, repr=False, compare=False)
 
     def as_gemini_content(self) -> dict:
-        from google.ai import generativelanguage as glm
-
-        return glm.Content(role=self.role, parts=[glm.Part(text=self.text)])
+        """Return this turn as a ``glm.Content``; treat the result as read-only."""
+        if self._gemini_content is None:
+            from google.ai import generativelanguage as glm
+
+            self._gemini_content = glm.Content(
+                role=self.role, parts=[glm.Part(text=self.text)]
+            )
+        return self._gemini_content
 
 
 MessageHistory = Sequence[ChatMessage]